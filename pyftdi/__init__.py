@@ -4,13 +4,17 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""FTDI device driver (pure Python)
+
+   <https://github.com/MelioraSci/pyftdi_win>
+"""
+
 #pylint: disable-msg=missing-docstring
 
 __version__ = '0.55.0'
 __title__ = 'PyFtdi_win'
 __description__ = 'FTDI device driver (pure Python)'
 __uri__ = 'https://github.com/MelioraSci/pyftdi_win'
-__doc__ = __description__ + ' <' + __uri__ + '>'
 __author__ = 'Meliora Scientific'
 # For all support requests, please open a new issue on GitHub
 __email__ = 'info@meliorasci.com'
@@ -21,22 +25,30 @@ __copyright__ = 'Copyright (c) 2023 Meliora Scientific Inc'
 from logging import WARNING, NullHandler, getLogger
 
 
-class FtdiLogger:
+_log = getLogger('pyftdi_win')
+_log.addHandler(NullHandler())
+_log.setLevel(level=WARNING)
+
+
+def set_formatter(formatter):
+    # setFormatter never alters the handler list, no need for a copy
+    for handler in _log.handlers:
+        handler.setFormatter(formatter)
 
-    log = getLogger('pyftdi_win')
-    log.addHandler(NullHandler())
-    log.setLevel(level=WARNING)
 
-    @classmethod
-    def set_formatter(cls, formatter):
-        handlers = list(cls.log.handlers)
-        for handler in handlers:
-            handler.setFormatter(formatter)
+def get_level():
+    return _log.getEffectiveLevel()
+
+
+def set_level(level):
+    _log.setLevel(level=level)
+
+
+class FtdiLogger:
+    """Legacy API, forwards to the module-level logger functions."""
 
-    @classmethod
-    def get_level(cls):
-        return cls.log.getEffectiveLevel()
+    log = _log
 
-    @classmethod
-    def set_level(cls, level):
-        cls.log.setLevel(level=level)
+    set_formatter = staticmethod(set_formatter)
+    get_level = staticmethod(get_level)
+    set_level = staticmethod(set_level)
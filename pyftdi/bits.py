@@ -367,7 +367,7 @@ class BitZSequence(BitSequence):
         BitSequence.__init__(self, value=value, msb=msb, length=length)
 
     def invert(self):
-        self._seq = [x in (None, BitZSequence.Z) and BitZSequence.Z or x ^ 1
+        self._seq = [BitZSequence.Z if x in (None, BitZSequence.Z) else x ^ 1
                      for x in self._seq]
         return self
 
@@ -14,8 +14,8 @@
 #pylint: disable-msg=import-error
 
 import sys
-from binascii import hexlify, unhexlify
-from collections import OrderedDict, namedtuple
+from binascii import unhexlify
+from collections import namedtuple
 from configparser import ConfigParser
 from enum import IntEnum
 if sys.version_info[:2] > (3, 5):
@@ -116,7 +116,7 @@ class FtdiEeprom:
         self._size = 0
         self._dev_ver = 0
         self._valid = False
-        self._config = OrderedDict()
+        self._config = {}
         self._dirty = set()
         self._modified = False
         self._chip: Optional[int] = None
@@ -186,7 +186,7 @@ class FtdiEeprom:
         self._eeprom = bytearray()
         self._dev_ver = 0
         self._valid = False
-        self._config = OrderedDict()
+        self._config = {}
         self._dirty = set()
         if not ignore:
             self._eeprom = self._read_eeprom()
@@ -380,7 +380,7 @@ class FtdiEeprom:
         length = 16
         for i in range(0, len(self._eeprom), length):
             chunk = self._eeprom[i:i+length]
-            hexa = hexlify(chunk).decode()
+            hexa = chunk.hex()
             cfg.set('raw', '@%02x' % i, hexa)
         cfg.write(file)
 
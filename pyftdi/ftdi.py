@@ -27,16 +27,15 @@
 
 """FTDI core driver."""
 
-from binascii import hexlify
-from collections import OrderedDict
-from enum import IntEnum, unique
+from enum import IntEnum, IntFlag, unique
 from errno import ENODEV
+from functools import lru_cache
 from logging import getLogger, DEBUG
-from struct import unpack as sunpack
-from sys import platform
+from struct import Struct
+from time import monotonic
 from typing import Callable, Optional, List, Sequence, TextIO, Tuple, Union
 from .misc import to_bool, to_int
-from ctypes import c_uint32, c_uint16, c_uint8, c_ulong, c_void_p, c_bool, c_char, c_char_p, create_string_buffer, byref
+from ctypes import c_uint32, c_uint16, c_uint8, c_ulong, c_void_p, c_bool, c_char, create_string_buffer, byref, POINTER
 import ctypes.util
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
@@ -72,6 +71,54 @@ class FtdiEepromError(FtdiError):
     """FTDI EEPROM access errors"""
 
 
+_EEPROM_WORD = Struct('<H')
+"""EEPROM 16-bit word, little endian."""
+
+_MPSSE_GPIO_CMD = Struct('BBB')
+"""MPSSE GPIO command: op-code, output value, direction."""
+
+_MPSSE_WORD_CMD = Struct('<BH')
+"""MPSSE command with a 16-bit argument, little endian."""
+
+_D2XX_PROTOTYPES = {
+    'FT_Read': (c_void_p, c_void_p, c_uint32, POINTER(c_uint32)),
+    'FT_Write': (c_void_p, c_void_p, c_uint32, POINTER(c_uint32)),
+    'FT_GetQueueStatus': (c_void_p, POINTER(c_uint32)),
+    'FT_GetModemStatus': (c_void_p, POINTER(c_uint32)),
+    'FT_Purge': (c_void_p, c_uint32),
+    'FT_SetBaudRate': (c_void_p, c_uint32),
+    'FT_SetTimeouts': (c_void_p, c_uint32, c_uint32),
+    'FT_ResetDevice': (c_void_p,),
+    'FT_CyclePort': (c_void_p,),
+    'FT_Close': (c_void_p,),
+    'FT_SetUSBParameters': (c_void_p, c_uint32, c_uint32),
+    'FT_SetBitMode': (c_void_p, c_uint8, c_uint8),
+    'FT_GetBitMode': (c_void_p, POINTER(c_uint8)),
+    'FT_SetLatencyTimer': (c_void_p, c_uint8),
+    'FT_GetLatencyTimer': (c_void_p, POINTER(c_uint8)),
+    'FT_SetFlowControl': (c_void_p, c_uint16, c_uint8, c_uint8),
+    'FT_SetChars': (c_void_p, c_uint8, c_uint8, c_uint8, c_uint8),
+    'FT_SetDtr': (c_void_p,),
+    'FT_ClrDtr': (c_void_p,),
+    'FT_SetRts': (c_void_p,),
+    'FT_ClrRts': (c_void_p,),
+    'FT_SetBreakOn': (c_void_p,),
+    'FT_SetBreakOff': (c_void_p,),
+    'FT_SetDataCharacteristics': (c_void_p, c_uint8, c_uint8, c_uint8),
+    'FT_ReadEE': (c_void_p, c_uint32, POINTER(c_uint16)),
+    'FT_WriteEE': (c_void_p, c_uint32, c_uint16),
+}
+"""Argument types of the D2XX functions, all of which return a FT_STATUS."""
+
+
+def _modem_status_lut(labels: Sequence[str], mask: int = 0xFF) -> \
+        Tuple[Tuple[str, ...], ...]:
+    """Build the table of decoded modem status flags for each byte value."""
+    return tuple(tuple(label for bit, label in enumerate(labels)
+                       if byte_ & mask & (1 << bit))
+                 for byte_ in range(256))
+
+
 class FtdiDeviceListInfoNode(ctypes.Structure):
     _fields_ = [("Flags", c_ulong),
                 ("Type", c_ulong),
@@ -97,34 +144,34 @@ class Ftdi:
     """
 
     PRODUCT_IDS = {
-        FTDI_VENDOR: OrderedDict((
-            # use an ordered dict so that the first occurence of a PID takes
+        FTDI_VENDOR: {
+            # dicts are ordered, so that the first occurence of a PID takes
             # precedence when generating URLs - order does matter.
-            ('232', 0x6001),
-            ('232r', 0x6001),
-            ('232h', 0x6014),
-            ('2232', 0x6010),
-            ('2232c', 0x6010),
-            ('2232d', 0x6010),
-            ('2232h', 0x6010),
-            ('4232', 0x6011),
-            ('4232h', 0x6011),
-            ('ft-x', 0x6015),
-            ('230x', 0x6015),
-            ('231x', 0x6015),
-            ('234x', 0x6015),
-            ('ft232', 0x6001),
-            ('ft232r', 0x6001),
-            ('ft232h', 0x6014),
-            ('ft2232', 0x6010),
-            ('ft2232c', 0x6010),
-            ('ft2232d', 0x6010),
-            ('ft2232h', 0x6010),
-            ('ft4232', 0x6011),
-            ('ft4232h', 0x6011),
-            ('ft230x', 0x6015),
-            ('ft231x', 0x6015),
-            ('ft234x', 0x6015)))
+            '232': 0x6001,
+            '232r': 0x6001,
+            '232h': 0x6014,
+            '2232': 0x6010,
+            '2232c': 0x6010,
+            '2232d': 0x6010,
+            '2232h': 0x6010,
+            '4232': 0x6011,
+            '4232h': 0x6011,
+            'ft-x': 0x6015,
+            '230x': 0x6015,
+            '231x': 0x6015,
+            '234x': 0x6015,
+            'ft232': 0x6001,
+            'ft232r': 0x6001,
+            'ft232h': 0x6014,
+            'ft2232': 0x6010,
+            'ft2232c': 0x6010,
+            'ft2232d': 0x6010,
+            'ft2232h': 0x6010,
+            'ft4232': 0x6011,
+            'ft4232h': 0x6011,
+            'ft230x': 0x6015,
+            'ft231x': 0x6015,
+            'ft234x': 0x6015}
         }
     """Supported products, only FTDI officials ones.
        To add third parties and customized products, see
@@ -145,6 +192,19 @@ class Ftdi:
         0x1000: 'ft-x'}
     """Common names of FTDI supported devices."""
 
+    DEVICE_TYPE_VERSIONS = (
+        0x0400,  # FT_DEVICE_BM
+        0x0200,  # FT_DEVICE_AM
+        0x0000,  # FT_DEVICE_100AX
+        0x0000,  # FT_DEVICE_UNKNOWN
+        0x0500,  # FT_DEVICE_2232C
+        0x0600,  # FT_DEVICE_232R
+        0x0700,  # FT_DEVICE_2232H
+        0x0800,  # FT_DEVICE_4232H
+        0x0900,  # FT_DEVICE_232H
+        0x1000)  # FT_DEVICE_X_SERIES
+    """Device versions, indexed by D2XX device type."""
+
     PORT_COUNTS = {
         0x0200: 1,
         0x0400: 1,
@@ -234,19 +294,37 @@ class Ftdi:
     DISABLE_CLK_DIV5 = 0x8a
     ENABLE_CLK_DIV5 = 0x8b
 
-    # Modem status
-    MODEM_CTS = (1 << 4)    # Clear to send
-    MODEM_DSR = (1 << 5)    # Data set ready
-    MODEM_RI = (1 << 6)     # Ring indicator
-    MODEM_RLSD = (1 << 7)   # Carrier detect
-    MODEM_DR = (1 << 8)     # Data ready
-    MODEM_OE = (1 << 9)     # Overrun error
-    MODEM_PE = (1 << 10)    # Parity error
-    MODEM_FE = (1 << 11)    # Framing error
-    MODEM_BI = (1 << 12)    # Break interrupt
-    MODEM_THRE = (1 << 13)  # Transmitter holding register
-    MODEM_TEMT = (1 << 14)  # Transmitter empty
-    MODEM_RCVE = (1 << 15)  # Error in RCVR FIFO
+    @unique
+    class ModemStatus(IntFlag):
+        """Modem status, as reported by :py:meth:`poll_modem_status`."""
+
+        CTS = (1 << 4)    # Clear to send
+        DSR = (1 << 5)    # Data set ready
+        RI = (1 << 6)     # Ring indicator
+        RLSD = (1 << 7)   # Carrier detect
+        DR = (1 << 8)     # Data ready
+        OE = (1 << 9)     # Overrun error
+        PE = (1 << 10)    # Parity error
+        FE = (1 << 11)    # Framing error
+        BI = (1 << 12)    # Break interrupt
+        THRE = (1 << 13)  # Transmitter holding register
+        TEMT = (1 << 14)  # Transmitter empty
+        RCVE = (1 << 15)  # Error in RCVR FIFO
+
+    # Modem status, legacy names. These are kept as plain integers, as
+    # masking an integer with an IntFlag member builds a new IntFlag
+    MODEM_CTS = int(ModemStatus.CTS)
+    MODEM_DSR = int(ModemStatus.DSR)
+    MODEM_RI = int(ModemStatus.RI)
+    MODEM_RLSD = int(ModemStatus.RLSD)
+    MODEM_DR = int(ModemStatus.DR)
+    MODEM_OE = int(ModemStatus.OE)
+    MODEM_PE = int(ModemStatus.PE)
+    MODEM_FE = int(ModemStatus.FE)
+    MODEM_BI = int(ModemStatus.BI)
+    MODEM_THRE = int(ModemStatus.THRE)
+    MODEM_TEMT = int(ModemStatus.TEMT)
+    MODEM_RCVE = int(ModemStatus.RCVE)
 
     # FTDI MPSSE commands
     SET_BITS_LOW = 0x80     # Change LSB GPIO output
@@ -270,6 +348,26 @@ class Ftdi:
     # FT232H only
     DRIVE_ZERO = 0x9e       # Drive-zero mode
 
+    MPSSE_BOGUS_OP = 0xAB
+    """Invalid op-code used to synchronize with the MPSSE engine."""
+
+    _MPSSE_SYNC_CMD = bytes((LOOPBACK_START, MPSSE_BOGUS_OP, LOOPBACK_END))
+    """MPSSE synchronization sequence, sent in loopback mode."""
+
+    _MPSSE_SYNC_RESP = bytes((0xFA, MPSSE_BOGUS_OP))
+    """MPSSE "bad command" reply to the synchronization sequence."""
+
+    _ADAPTIVE_CLOCK_CMDS = (bytes((DISABLE_CLK_ADAPTIVE,)),
+                            bytes((ENABLE_CLK_ADAPTIVE,)))
+    """Adaptive clock MPSSE commands, indexed by enablement."""
+
+    _3PHASE_CLOCK_CMDS = (bytes((DISABLE_CLK_3PHASE,)),
+                          bytes((ENABLE_CLK_3PHASE,)))
+    """3-phase clock MPSSE commands, indexed by enablement."""
+
+    _LOOPBACK_CMDS = (bytes((LOOPBACK_END,)), bytes((LOOPBACK_START,)))
+    """Loopback MPSSE commands, indexed by enablement."""
+
     # Reset arguments
     SIO_RESET_SIO = 0        # Reset device
     SIO_RESET_PURGE_RX = 1   # Drain USB RX buffer (host-to-ftdi)
@@ -280,6 +378,8 @@ class Ftdi:
     SIO_RTS_CTS_HS = (0x1 << 8)
     SIO_DTR_DSR_HS = (0x2 << 8)
     SIO_XON_XOFF_HS = (0x4 << 8)
+    FLOW_CONTROLS = {'hw': SIO_RTS_CTS_HS, '': SIO_DISABLE_FLOW_CTRL}
+    """Supported flow control modes, see :py:meth:`set_flowctrl`."""
     SIO_SET_DTR_MASK = 0x1
     SIO_SET_DTR_HIGH = (SIO_SET_DTR_MASK | (SIO_SET_DTR_MASK << 8))
     SIO_SET_DTR_LOW = (0x0 | (SIO_SET_DTR_MASK << 8))
@@ -296,6 +396,16 @@ class Ftdi:
     # Break type
     BREAK_OFF, BREAK_ON = range(2)
 
+    _LINE_PARITIES = {'N': PARITY_NONE, 'O': PARITY_ODD, 'E': PARITY_EVEN,
+                      'M': PARITY_MARK, 'S': PARITY_SPACE}
+    """UART parity modes, see :py:meth:`set_line_property`."""
+
+    _LINE_STOP_BITS = {1: STOP_BIT_1, 1.5: STOP_BIT_15, 2: STOP_BIT_2}
+    """UART stop bit counts, see :py:meth:`set_line_property`."""
+
+    _LINE_BITS = {7: BITS_7, 8: BITS_8}
+    """UART character lengths, see :py:meth:`set_line_property`."""
+
     # cts:  Clear to send
     # dsr:  Data set ready
     # ri:   Ring indicator
@@ -315,6 +425,12 @@ class Ftdi:
     ERROR_BITS = (0x00, 0x8E)
     TX_EMPTY_BITS = 0x60
 
+    # decoded modem status, indexed by status byte position then value
+    _MODEM_STATUS_LUT = (_modem_status_lut(MODEM_STATUS[0]),
+                         _modem_status_lut(MODEM_STATUS[1]))
+    _MODEM_ERROR_LUT = (_modem_status_lut(MODEM_STATUS[0], ERROR_BITS[0]),
+                        _modem_status_lut(MODEM_STATUS[1], ERROR_BITS[1]))
+
     # Clocks and baudrates
     BUS_CLOCK_BASE = 6.0E6  # 6 MHz
     BUS_CLOCK_HIGH = 30.0E6  # 30 MHz
@@ -324,6 +440,12 @@ class Ftdi:
     BITBANG_BAUDRATE_RATIO_HIGH = 5
     BAUDRATE_TOLERANCE = 3.0  # acceptable clock drift for UART, in %
 
+    _BAUDRATE_CLOCKS = (
+        (BAUDRATE_REF_BASE, BITBANG_BAUDRATE_RATIO_BASE, 0),
+        (BAUDRATE_REF_HIGH, BITBANG_BAUDRATE_RATIO_HIGH, 0x00020000))
+    """Baudrate reference clock, bitbang ratio and divisor flag, indexed by
+       high speed clock selection."""
+
     FRAC_DIV_CODE = (0, 3, 2, 4, 1, 5, 6, 7)
 
     # Latency
@@ -331,6 +453,20 @@ class Ftdi:
     LATENCY_MAX = 255
     LATENCY_EEPROM_FT232R = 77
 
+    # D2XX USB transfer sizes (FT_SetUSBParameters), in bytes
+    USB_TRANSFER_SIZE_MIN = 64
+    USB_TRANSFER_SIZE_MAX = 64 << 10
+    USB_TRANSFER_SIZE = USB_TRANSFER_SIZE_MAX
+
+    # Upper bound of the read/write buffer chunk sizes, in bytes
+    CHUNK_SIZE_MAX = 1 << 20
+
+    # D2XX serial number suffixes of multi-port devices, per interface
+    INTERFACE_SUFFIXES = ('A', 'B', 'C', 'D')
+
+    # D2XX FT_OpenEx flags
+    FT_OPEN_BY_SERIAL_NUMBER = 1
+
     # EEPROM Properties
     EXT_EEPROM_SIZES = (128, 256) # in bytes (93C66 seen as 93C56)
 
@@ -348,9 +484,26 @@ class Ftdi:
         self._readbuffer = bytearray()
         self._readoffset = 0
         self._readbuffer_chunksize = 4 << 10  # 4KiB
-        self._raw_readbuffer = (c_uint8 * self._readbuffer_chunksize)()
+        self._rx_buffer = bytearray(self._readbuffer_chunksize)
+        self._raw_readbuffer = \
+            (c_uint8 * self._readbuffer_chunksize).from_buffer(self._rx_buffer)
         self._writebuffer_chunksize = 4 << 10  # 4KiB
         self._max_packet_size = 0
+        # device characteristics, only valid once connected
+        self._port_width = 8
+        self._has_wide_port = False
+        self._has_mpsse = False
+        self._has_cbus = False
+        self._has_drivezero = False
+        self._is_legacy = False
+        self._is_H_series = False
+        self._fifo_sizes = None
+        self._ic_name = 'undefined'
+        self._port_count = 0
+        self._frequency_max = self.BUS_CLOCK_BASE
+        self._convert_baudrate = self._convert_baudrate_fractional
+        self._usb_in_transfer_size = self.USB_TRANSFER_SIZE
+        self._usb_out_transfer_size = self.USB_TRANSFER_SIZE
         self._interface = None
         self._index = None
         self._in_ep = None
@@ -361,13 +514,30 @@ class Ftdi:
         self._latency_min = self.LATENCY_MIN
         self._latency_max = self.LATENCY_MAX
         self._latency_threshold = None  # disable dynamic latency
+        self._latency_timer = None  # last latency set on the device
+        self._dtr_state = None  # last DTR level set on the device
+        self._rts_state = None  # last RTS level set on the device
         self._event_char = 0
         self._event_char_enabled = False
         self._error_char = 0
         self._error_char_enabled = False
+        self._chars = None  # last special chars set on the device
+        self._eeprom_cache = None  # last known whole EEPROM content
         self._cbus_pins = (0, 0)
         self._cbus_out = 0
+        self._cbus_bitmask = None  # last CBUS configuration set on the device
         self._tracer = None
+        self._tx_cork = None
+        self._d2xx = None
+        self._handle = None
+        # D2XX output parameters, reused from one call to another. Reads and
+        # writes may run concurrently from different threads, as the GIL is
+        # released during D2XX calls, so each one gets its own counter
+        self._c_read_count = c_uint32()
+        self._c_write_count = c_uint32()
+        self._c_status = c_uint32()
+        self._c_pins = c_uint8()
+        self._status_expiry = 0.0  # when the cached modem status is stale
 
     # --- Public API -------------------------------------------------------
 
@@ -393,8 +563,8 @@ class Ftdi:
            :return: list of (UsbDeviceDescriptor, interface)
         """
         d2xx = cls._load_backend()
-        numDevices = ctypes.c_ulong()
-        r = d2xx.FT_CreateDeviceInfoList(ctypes.byref(numDevices))
+        numDevices = c_ulong()
+        r = d2xx.FT_CreateDeviceInfoList(byref(numDevices))
         if r != 0 or numDevices.value == 0:
             return []
 
@@ -437,7 +607,16 @@ class Ftdi:
 
            :param url: input URL to parse
         """
+        return cls._parse_url(url)
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _parse_url(cls, url: str) -> Tuple[str, int]:
+        """Parse a device URL, see :py:meth:`get_identifiers`.
+
+           The same URLs are parsed over and over as devices get reopened,
+           so results are memoized.
+        """
         urlparts = urlsplit(url)
         if urlparts.scheme != cls.SCHEME:
             raise FtdiError("Invalid URL: %s" % url)
@@ -446,7 +625,7 @@ class Ftdi:
             if not urlparts.path:
                 raise FtdiError('URL string is missing device port')
             path = urlparts.path.strip('/')
-            if path == '?' or (not path and urlstr.endswith('?')):
+            if path == '?' or (not path and url.endswith('?')):
                 return None
 
             interface = to_int(path)
@@ -504,14 +683,21 @@ class Ftdi:
            :param error_only: only decode error flags
            :return: a tuple of status identifiers
         """
-        status = []
-        for pos, (byte_, ebits) in enumerate(zip(value, cls.ERROR_BITS)):
-            for bit, _ in enumerate(cls.MODEM_STATUS[pos]):
-                if error_only:
-                    byte_ &= ebits
-                if byte_ & (1 << bit):
-                    status.append(cls.MODEM_STATUS[pos][bit])
-        return tuple(status)
+        lut = cls._MODEM_ERROR_LUT if error_only else cls._MODEM_STATUS_LUT
+        return lut[0][value[0]] + lut[1][value[1]]
+
+    @classmethod
+    def has_modem_error(cls, value: bytes) -> bool:
+        """Tell whether the FTDI modem status reports an error.
+
+           This is a cheaper alternative to :py:meth:`decode_modem_status`
+           when only the presence of an error matters.
+
+           :param value: 2-byte modem status
+           :return: True if any error flag is set
+        """
+        return bool((value[0] & cls.ERROR_BITS[0]) |
+                    (value[1] & cls.ERROR_BITS[1]))
 
     @staticmethod
     def find_all(vps: Sequence[Tuple[int, int]], nocache: bool = False) -> \
@@ -548,7 +734,9 @@ class Ftdi:
     def open(self, vendor: int, product: int, bus: Optional[int] = None,
              address: Optional[int] = None, index: int = 0,
              serial: Optional[str] = None,
-             interface: int = 1)  -> None:
+             interface: int = 1,
+             in_transfer_size: Optional[int] = None,
+             out_transfer_size: Optional[int] = None) -> None:
         """Open a new interface to the specified FTDI device.
 
            If several FTDI devices of the same kind (vid, pid) are connected
@@ -572,26 +760,69 @@ class Ftdi:
            :param str serial: optional selector, specified the FTDI device
                               by its serial number
            :param str interface: FTDI interface/port
+           :param in_transfer_size: optional D2XX USB IN transfer size, in
+                                    bytes
+           :param out_transfer_size: optional D2XX USB OUT transfer size, in
+                                     bytes
         """
-        self.open_from_device(serial, interface)
+        self.open_from_device(serial, interface,
+                              in_transfer_size=in_transfer_size,
+                              out_transfer_size=out_transfer_size)
 
     def open_from_device(self, device: str,
-                         interface: int = 1) -> None:
+                         interface: int = 1,
+                         in_transfer_size: Optional[int] = None,
+                         out_transfer_size: Optional[int] = None) -> None:
         """Open a new interface from an existing USB device.
 
+           Larger USB transfer sizes amortize the USB round-trip cost over
+           more bytes, smaller ones reduce the delay before the driver
+           returns a partially filled buffer. D2XX accepts multiples of 64
+           bytes, up to 64 KiB.
+
            :param device: FTDI serial number string
            :param interface: FTDI interface to use (integer starting from 1)
-        """
+           :param in_transfer_size: D2XX USB IN transfer size, in bytes,
+                                    default to :py:const:`USB_TRANSFER_SIZE`
+           :param out_transfer_size: D2XX USB OUT transfer size, in bytes,
+                                     default to :py:const:`USB_TRANSFER_SIZE`
+           :raise ValueError: if a transfer size is not supported
+        """
+        if in_transfer_size is None:
+            in_transfer_size = self.USB_TRANSFER_SIZE
+        if out_transfer_size is None:
+            out_transfer_size = self.USB_TRANSFER_SIZE
+        for size in (in_transfer_size, out_transfer_size):
+            if (not self.USB_TRANSFER_SIZE_MIN <= size <=
+                    self.USB_TRANSFER_SIZE_MAX) or size & 0x3F:
+                raise ValueError('Invalid USB transfer size: %d' % size)
         self._base_serial_num = device
         self._index = interface
 
         self._d2xx = self._load_backend()
-
-        sn = device
-        sn += chr(ord('A') + interface - 1)
-
+        # resolve the frequently used functions once, rather than on each
+        # call
+        self._ft_read = self._d2xx.FT_Read
+        self._ft_write = self._d2xx.FT_Write
+        self._ft_get_queue_status = self._d2xx.FT_GetQueueStatus
+        self._ft_get_modem_status = self._d2xx.FT_GetModemStatus
+        self._ft_purge = self._d2xx.FT_Purge
+        self._ft_set_bit_mode = self._d2xx.FT_SetBitMode
+        self._ft_get_bit_mode = self._d2xx.FT_GetBitMode
+        self._ft_set_dtr = self._d2xx.FT_SetDtr
+        self._ft_clr_dtr = self._d2xx.FT_ClrDtr
+        self._ft_set_rts = self._d2xx.FT_SetRts
+        self._ft_clr_rts = self._d2xx.FT_ClrRts
+
+        if not 1 <= interface <= len(self.INTERFACE_SUFFIXES):
+            raise FtdiError('Invalid FTDI interface: %d' % interface)
+        sn = device + self.INTERFACE_SUFFIXES[interface - 1]
+
+        # bytes are natively marshalled as char *, no c_char_p wrapper needed
         self._handle = c_void_p()
-        r = self._d2xx.FT_OpenEx(c_char_p(bytes(sn,'ascii')), 1, byref(self._handle))
+        r = self._d2xx.FT_OpenEx(sn.encode('ascii'),
+                                 self.FT_OPEN_BY_SERIAL_NUMBER,
+                                 byref(self._handle))
         if r != 0:
             raise FtdiError(f'No such FTDI device found: {device}/{interface}')
 
@@ -600,33 +831,25 @@ class Ftdi:
         devID = c_ulong()
         serNum = create_string_buffer(16)
         devDesc = create_string_buffer(64)
-        r = self._d2xx.FT_GetDeviceInfo(self._handle, byref(devType), byref(devID), serNum, devDesc, c_void_p())
+        r = self._d2xx.FT_GetDeviceInfo(self._handle, byref(devType), byref(devID), serNum, devDesc, None)
         if r != 0:
-            raise FtdiError('Unable to retrieve info on FTDI device %s/%d' % device % interface)
-
-        if devType.value == 0:
-            self._devVersion = 0x0400
-        elif devType.value == 1:
-            self._devVersion = 0x0200
-        elif devType.value == 4:
-            self._devVersion = 0x0500
-        elif devType.value == 5:
-            self._devVersion = 0x0600
-        elif devType.value == 6:
-            self._devVersion = 0x0700
-        elif devType.value == 7:
-            self._devVersion = 0x0800
-        elif devType.value == 8:
-            self._devVersion = 0x0900
-        elif devType.value == 9:
-            self._devVersion = 0x1000
-        else:
+            raise FtdiError('Unable to retrieve info on FTDI device %s/%d' %
+                            (device, interface))
+
+        try:
+            self._devVersion = self.DEVICE_TYPE_VERSIONS[devType.value]
+        except IndexError:
             self._devVersion = 0x0000
+        self._set_device_characteristics(self._devVersion)
 
 
-        r = self._d2xx.FT_SetUSBParameters(self._handle, c_uint32(65536), c_uint32(65536))
+        r = self._d2xx.FT_SetUSBParameters(self._handle, in_transfer_size,
+                                           out_transfer_size)
         if r != 0:
-            raise FtdiError('Unable to configure transfer sizes for FTDI device %s/%d' % device % interface)
+            raise FtdiError('Unable to configure transfer sizes for FTDI device %s/%d' %
+                            (device, interface))
+        self._usb_in_transfer_size = in_transfer_size
+        self._usb_out_transfer_size = out_transfer_size
 
         self._update_timeouts()
 
@@ -639,18 +862,28 @@ class Ftdi:
         self.purge_buffers()
         # Shallow reset
         self._reset_device()
-        # Reset feature mode
+        # Reset feature mode, current device setting is not known yet
+        self._bitmode = None
+        self._eeprom_cache = None
+        self._status_expiry = 0.0
         self.set_bitmode(0, Ftdi.BitMode.RESET)
-        # Init latency
+        # Init latency, current device setting is not known yet
         self._latency_threshold = None
+        self._latency_timer = None
         self.set_latency_timer(self.LATENCY_MIN)
         self._debug_log = self.log.getEffectiveLevel() == DEBUG
 
     def close(self) -> None:
         """Close the FTDI interface/port."""
         if self._d2xx and self._handle:
-            self._d2xx.FT_Close(self._handle)
-            self._handle = None
+            try:
+                # do not silently drop pending corked data
+                self._flush_cork()
+            finally:
+                self._tx_cork = None
+                self._d2xx.FT_Close(self._handle)
+                self._handle = None
+        self._tx_cork = None
 
     def reset(self, usb_reset: bool = False) -> None:
         """Reset FTDI device.
@@ -669,7 +902,8 @@ class Ftdi:
 
     def open_mpsse_from_url(self, url: str, direction: int = 0x0,
                             initial: int = 0x0, frequency: float = 6.0E6,
-                            latency: int = 16, debug: bool = False) -> float:
+                            latency: int = LATENCY_MIN,
+                            debug: bool = False) -> float:
         """Open a new interface to the specified FTDI device in MPSSE mode.
 
            MPSSE enables I2C, SPI, JTAG or other synchronous serial interface
@@ -683,7 +917,8 @@ class Ftdi:
            :param float frequency: serial interface clock in Hz
            :param latency: low-level latency in milliseconds. The shorter
                 the delay, the higher the host CPU load. Do not use shorter
-                values than the default, as it triggers data loss in FTDI.
+                values than :py:const:`LATENCY_MIN`, the default, as it
+                triggers data loss in FTDI.
            :param debug: use a tracer to decode MPSSE protocol
            :return: actual bus frequency in Hz
         """
@@ -699,7 +934,7 @@ class Ftdi:
                    address: Optional[int] = None, index: int = 0,
                    serial: Optional[str] = None, interface: int = 1,
                    direction: int = 0x0, initial: int = 0x0,
-                   frequency: float = 6.0E6, latency: int = 16,
+                   frequency: float = 6.0E6, latency: int = LATENCY_MIN,
                    debug: bool = False) -> float:
         """Open a new interface to the specified FTDI device in MPSSE mode.
 
@@ -735,7 +970,8 @@ class Ftdi:
            :param frequency: serial interface clock in Hz
            :param latency: low-level latency in milliseconds. The shorter
                 the delay, the higher the host CPU load. Do not use shorter
-                values than the default, as it triggers data loss in FTDI.
+                values than :py:const:`LATENCY_MIN`, the default, as it
+                triggers data loss in FTDI.
            :param bool debug: use a tracer to decode MPSSE protocol
            :return: actual bus frequency in Hz
         """
@@ -749,7 +985,8 @@ class Ftdi:
     def open_mpsse_from_device(self, device: str,
                                interface: int = 1, direction: int = 0x0,
                                initial: int = 0x0, frequency: float = 6.0E6,
-                               latency: int = 16, tracer: bool = False,
+                               latency: int = LATENCY_MIN,
+                               tracer: bool = False,
                                debug: bool = False) -> float:
         """Open a new interface to the specified FTDI device in MPSSE mode.
 
@@ -778,7 +1015,8 @@ class Ftdi:
            :param frequency: serial interface clock in Hz
            :param latency: low-level latency in milliseconds. The shorter
                 the delay, the higher the host CPU load. Do not use shorter
-                values than the default, as it triggers data loss in FTDI.
+                values than :py:const:`LATENCY_MIN`, the default, as it
+                triggers data loss in FTDI.
            :param bool tracer: use a tracer to decode MPSSE protocol
            :param bool debug: add more debug traces
            :return: actual bus frequency in Hz
@@ -802,34 +1040,31 @@ class Ftdi:
         # Drain buffers
         self.purge_buffers()
         # Disable event and error characters
-        self.set_event_char(0, False)
-        self.set_error_char(0, False)
+        self.set_chars(0, False, 0, False)
         # Enable MPSSE mode
         self.set_bitmode(direction, Ftdi.BitMode.MPSSE)
         # Configure clock
         frequency = self._set_frequency(frequency)
 
-        self.enable_loopback_mode(True)
-        # Write a bogus MPSSE op-code
-        self.write_data(bytearray((0xAB,)))
-        resp = self.read_data(2)
-        if len(resp) < 2 or resp[0] != 0xFA or resp[1] != 0xAB:
-            raise FtdiMpsseError('Unable to synchronize MPSSE')
-        self.enable_loopback_mode(False)
-
-        # Configure I/O
-        cmd = bytearray((Ftdi.SET_BITS_LOW, initial & 0xFF, direction & 0xFF))
+        # Synchronize with a bogus MPSSE op-code in loopback mode, then
+        # configure I/O, all in a single USB request
+        cmd = Ftdi._MPSSE_SYNC_CMD + \
+            _MPSSE_GPIO_CMD.pack(Ftdi.SET_BITS_LOW,
+                                 initial & 0xFF, direction & 0xFF)
         if self.has_wide_port:
-            initial >>= 8
-            direction >>= 8
-            cmd.extend((Ftdi.SET_BITS_HIGH, initial & 0xFF, direction & 0xFF))
+            cmd += _MPSSE_GPIO_CMD.pack(Ftdi.SET_BITS_HIGH,
+                                        (initial >> 8) & 0xFF,
+                                        (direction >> 8) & 0xFF)
         self.write_data(cmd)
+        if self.read_data(2) != Ftdi._MPSSE_SYNC_RESP:
+            raise FtdiMpsseError('Unable to synchronize MPSSE')
         self.validate_mpsse()
         # Return the actual frequency
         return frequency
 
     def open_bitbang_from_url(self, url: str, direction: int = 0x0,
-                              latency: int = 16, baudrate: int = 1000000,
+                              latency: int = LATENCY_MIN,
+                              baudrate: int = 1000000,
                               sync: bool = False) -> float:
         """Open a new interface to the specified FTDI device in bitbang mode.
 
@@ -856,7 +1091,8 @@ class Ftdi:
                      bus: Optional[int] = None, address: Optional[int] = None,
                      index: int = 0, serial: Optional[str] = None,
                      interface: int = 1, direction: int = 0x0,
-                     latency: int = 16, baudrate: int = 1000000,
+                     latency: int = LATENCY_MIN,
+                     baudrate: int = 1000000,
                      sync: bool = False) -> float:
         """Open a new interface to the specified FTDI device in bitbang mode.
 
@@ -886,7 +1122,8 @@ class Ftdi:
 
     def open_bitbang_from_device(self, device: str,
                                  interface: int = 1, direction: int = 0x0,
-                                 latency: int = 16, baudrate: int = 1000000,
+                                 latency: int = LATENCY_MIN,
+                                 baudrate: int = 1000000,
                                  sync: bool = False) -> int:
         """Open a new interface to the specified FTDI device in bitbang mode.
 
@@ -957,7 +1194,7 @@ class Ftdi:
         """
         if not self.is_connected:
             return 'unknown'
-        return self.DEVICE_NAMES.get(self.device_version, 'undefined')
+        return self._ic_name
 
     @property
     def device_port_count(self) -> int:
@@ -967,7 +1204,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.PORT_COUNTS.get(self.device_version, 0)
+        return self._port_count
 
     @property
     def port_index(self) -> int:
@@ -988,11 +1225,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        if self.device_version in (0x0700, 0x0900):
-            return 16
-        if self.device_version in (0x0500, ):
-            return 12
-        return 8
+        return self._port_width
 
     @property
     def has_mpsse(self) -> bool:
@@ -1003,7 +1236,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.device_version in (0x0500, 0x0700, 0x0800, 0x0900)
+        return self._has_mpsse
 
     @property
     def has_wide_port(self) -> bool:
@@ -1012,7 +1245,9 @@ class Ftdi:
            :return: True if the FTDI device supports wide GPIO port
            :raise FtdiError: if no FTDI port is open
         """
-        return self.port_width > 8
+        if not self.is_connected:
+            raise FtdiError('Device characteristics not yet known')
+        return self._has_wide_port
 
     @property
     def has_cbus(self) -> bool:
@@ -1030,7 +1265,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.device_version in (0x0600, 0x0900, 0x1000)
+        return self._has_cbus
 
     @property
     def has_drivezero(self) -> bool:
@@ -1043,7 +1278,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.device_version in (0x0900, )
+        return self._has_drivezero
 
     @property
     def is_legacy(self) -> bool:
@@ -1055,7 +1290,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.device_version <= 0x0200
+        return self._is_legacy
 
     @property
     def is_H_series(self) -> bool:
@@ -1066,7 +1301,7 @@ class Ftdi:
         """
         if not self.is_connected:
             raise FtdiError('Device characteristics not yet known')
-        return self.device_version in (0x0700, 0x0800, 0x0900)
+        return self._is_H_series
 
 
     @property
@@ -1111,7 +1346,9 @@ class Ftdi:
 
            :return: the maximum supported frequency in Hz
         """
-        return Ftdi.BUS_CLOCK_HIGH if self.is_H_series else Ftdi.BUS_CLOCK_BASE
+        if not self.is_connected:
+            raise FtdiError('Device characteristics not yet known')
+        return self._frequency_max
 
     @property
     def fifo_sizes(self) -> Tuple[int, int]:
@@ -1119,11 +1356,12 @@ class Ftdi:
 
            :return: 2-tuple of TX, RX FIFO size in bytes
         """
-        try:
-            return Ftdi.FIFO_SIZES[self.device_version]
-        except KeyError:
+        if not self.is_connected:
+            raise FtdiError('Device characteristics not yet known')
+        if self._fifo_sizes is None:
             raise FtdiFeatureError('Unsupported device: 0x%04x' %
-                                   self.device_version)
+                                   self._devVersion)
+        return self._fifo_sizes
 
     @property
     def mpsse_bit_delay(self) -> float:
@@ -1195,7 +1433,8 @@ class Ftdi:
     def purge_rx_buffer(self) -> None:
         """Clear the USB receive buffer on the chip (host-to-ftdi) and the
            internal read buffer."""
-        if self._d2xx.FT_Purge(self._handle, c_ulong(1)) != 0:
+        self._flush_cork()
+        if self._ft_purge(self._handle, Ftdi.SIO_RESET_PURGE_RX) != 0:
             raise FtdiError('Unable to flush RX buffer')
         # Invalidate data in the readbuffer
         self._readoffset = 0
@@ -1204,13 +1443,21 @@ class Ftdi:
 
     def purge_tx_buffer(self) -> None:
         """Clear the USB transmit buffer on the chip (ftdi-to-host)."""
-        if self._d2xx.FT_Purge(self._handle, c_ulong(2)) != 0:
+        self._flush_cork()
+        if self._ft_purge(self._handle, Ftdi.SIO_RESET_PURGE_TX) != 0:
             raise FtdiError('Unable to flush TX buffer')
 
     def purge_buffers(self) -> None:
         """Clear the buffers on the chip and the internal read buffer."""
-        self.purge_rx_buffer()
-        self.purge_tx_buffer()
+        self._flush_cork()
+        # Both directions are cleared with a single control request
+        if self._ft_purge(self._handle, Ftdi.SIO_RESET_PURGE_RX |
+                          Ftdi.SIO_RESET_PURGE_TX) != 0:
+            raise FtdiError('Unable to flush buffers')
+        # Invalidate data in the readbuffer
+        self._readoffset = 0
+        self._readbuffer = bytearray()
+        self.log.debug('rx/tx buf purged')
 
     def write_data_set_chunksize(self, chunksize: int = 0) -> None:
         """Configure write buffer chunk size.
@@ -1220,10 +1467,14 @@ class Ftdi:
 
            :param chunksize: the optional size of the write buffer in bytes,
                              it is recommended to use 0 to force automatic
-                             evaluation of the best value.
+                             evaluation of the best value. It is capped to
+                             :py:const:`CHUNK_SIZE_MAX`.
         """
         if chunksize == 0:
-            chunksize = self.fifo_sizes[0]
+            # D2XX splits each write into USB OUT requests on its own, so
+            # a whole USB OUT request can be handed over at once
+            chunksize = max(self._usb_out_transfer_size, self.fifo_sizes[0])
+        chunksize = min(chunksize, self.CHUNK_SIZE_MAX)
         self._writebuffer_chunksize = chunksize
         self.log.debug('TX chunksize: %d', self._writebuffer_chunksize)
 
@@ -1242,25 +1493,26 @@ class Ftdi:
 
            :param chunksize: the optional size of the read buffer in bytes,
                              it is recommended to use 0 to force automatic
-                             evaluation of the best value.
+                             evaluation of the best value. It is rounded up
+                             to a multiple of the USB packet size, and
+                             capped to :py:const:`CHUNK_SIZE_MAX`.
         """
         # Invalidate all remaining data
         self._readoffset = 0
         self._readbuffer = bytearray()
         if chunksize == 0:
-            # status byte prolog is emitted every maxpacketsize, but for "some"
-            # reasons, FT232R emits it every RX FIFO size bytes... Other
-            # devices use a maxpacketsize which is smaller or equal to their
-            # FIFO size, so this weird behavior is for now only experienced
-            # with FT232R. Any, the following compution should address all
-            # devices.
-            chunksize = min(self.fifo_sizes[0], self.fifo_sizes[1],
-                            self._max_packet_size)
-        if platform == 'linux':
-            if chunksize > 16384:
-                chunksize = 16384
+            # D2XX strips the per-packet modem status bytes and reassembles
+            # the USB packets, so a whole USB IN request can be retrieved
+            # with a single FT_Read call
+            chunksize = max(self._usb_in_transfer_size, self.fifo_sizes[1])
+        packet_size = self._max_packet_size or self.USB_TRANSFER_SIZE_MIN
+        chunksize = -(-chunksize // packet_size) * packet_size
+        chunksize = min(chunksize, self.CHUNK_SIZE_MAX)
         self._readbuffer_chunksize = chunksize
-        self._raw_readbuffer = (c_uint8 * self._readbuffer_chunksize)()
+        # D2XX fills in the bytearray storage through the ctypes view
+        self._rx_buffer = bytearray(chunksize)
+        self._raw_readbuffer = \
+            (c_uint8 * chunksize).from_buffer(self._rx_buffer)
         self.log.debug('RX chunksize: %d', self._readbuffer_chunksize)
 
     def read_data_get_chunksize(self) -> int:
@@ -1270,15 +1522,30 @@ class Ftdi:
         """
         return self._readbuffer_chunksize
 
+    def _set_cbus_bitmask(self, bitmask: int) -> None:
+        """Enter CBUS bitbang mode with the specified pin configuration,
+           unless the interface already uses it."""
+        if self._bitmode == Ftdi.BitMode.CBUS and \
+                self._cbus_bitmask == bitmask:
+            return
+        self.set_bitmode(bitmask, Ftdi.BitMode.CBUS)
+
     def set_bitmode(self, bitmask: int, mode: 'Ftdi.BitMode') -> None:
         """Enable/disable bitbang modes.
 
            Switch the FTDI interface to bitbang mode.
+
+           Resetting an interface which is already in reset mode is a no-op.
         """
+        if mode == Ftdi.BitMode.RESET and not bitmask and \
+                self._bitmode == mode:
+            return
         self.log.debug('bitmode: %s', mode.name)
-        if self._d2xx.FT_SetBitMode(self._handle, c_uint8(bitmask), c_uint8(mode.value)) != 0:
+        self._flush_cork()
+        if self._ft_set_bit_mode(self._handle, bitmask, mode.value) != 0:
             raise FtdiError('Unable to set bitmode')
         self._bitmode = mode
+        self._cbus_bitmask = bitmask if mode == Ftdi.BitMode.CBUS else None
 
     def read_pins(self) -> int:
         """Directly read pin state, circumventing the read buffer.
@@ -1286,10 +1553,10 @@ class Ftdi:
 
            :return: bitfield of FTDI interface input GPIO
         """
-        pins = c_uint8()
-        if self._d2xx.FT_GetBitMode(self._handle, byref(pins)) != 0:
+        self._flush_cork()
+        if self._ft_get_bit_mode(self._handle, self._c_pins) != 0:
             raise FtdiError('Unable to read pins')
-        return pins.value
+        return self._c_pins.value
 
     def set_cbus_direction(self, mask: int, direction: int) -> None:
         """Configure the CBUS pins used as GPIOs
@@ -1316,7 +1583,7 @@ class Ftdi:
         outv = (self._cbus_pins[1] << 4) | self._cbus_out
         oldmode = self._bitmode
         try:
-            self.set_bitmode(outv, Ftdi.BitMode.CBUS)
+            self._set_cbus_bitmask(outv)
             inv = self.read_pins()
             #print(f'BM {outv:04b} {inv:04b}')
         finally:
@@ -1340,7 +1607,7 @@ class Ftdi:
         value = (self._cbus_pins[1] << 4) | pins
         oldmode = self._bitmode
         try:
-            self.set_bitmode(value, Ftdi.BitMode.CBUS)
+            self._set_cbus_bitmask(value)
             self._cbus_out = pins
         finally:
             if oldmode != self._bitmode:
@@ -1360,8 +1627,13 @@ class Ftdi:
         """
         if not Ftdi.LATENCY_MIN <= latency <= Ftdi.LATENCY_MAX:
             raise ValueError("Latency out of range")
-        if self._d2xx.FT_SetLatencyTimer(self._handle, c_uint8(latency)) != 0:
+        if latency == self._latency_timer:
+            # spare a USB control request
+            return
+        if self._d2xx.FT_SetLatencyTimer(self._handle, latency) != 0:
+            self._latency_timer = None
             raise FtdiError('Unable to latency timer')
+        self._latency_timer = latency
 
     def get_latency_timer(self) -> int:
         """Get latency timer.
@@ -1387,22 +1659,17 @@ class Ftdi:
 
            :return: modem status, as a proprietary bitfield
         """
-        value = c_uint32()
-        if self._d2xx.FT_GetModemStatus(self._handle, byref(value)) != 0:
-            raise FtdiError('Unable to get modem status')
-        status, = sunpack('<H', value.value)
-        return status
+        self._poll_modem_status()
+        # D2XX reports the two status bytes in the LSBs of a 32-bit word
+        return self._c_status.value & 0xFFFF
 
     def modem_status(self) -> Tuple[str, ...]:
         """Provide the current modem status as a tuple of set signals
 
            :return: decodede modem status as short strings
         """
-        value = c_uint32()
-        if self._d2xx.FT_GetModemStatus(self._handle, byref(value)) != 0:
-            raise FtdiError('Unable to get modem status')
-        status = [value.value & 0xFF, (value.value >> 8) & 0xFF]
-        return self.decode_modem_status(status)
+        status = self.poll_modem_status()
+        return self.decode_modem_status((status & 0xFF, status >> 8))
 
     def set_flowctrl(self, flowctrl: str) -> None:
         """Select flowcontrol in UART mode.
@@ -1447,13 +1714,11 @@ class Ftdi:
                 Word to the wise. Not only do RS232 level shifting devices
                 level shift, but they also invert the signal.
         """
-        ctrl = {'hw': Ftdi.SIO_RTS_CTS_HS,
-                '': Ftdi.SIO_DISABLE_FLOW_CTRL}
         try:
-            value = ctrl[flowctrl]
+            value = Ftdi.FLOW_CONTROLS[flowctrl]
         except KeyError:
             raise ValueError('Unknown flow control: %s' % flowctrl)
-        if self._d2xx.FT_SetFlowControl(self._handle, c_uint16(value), c_uint8(0), c_uint8(0)) != 0:
+        if self._d2xx.FT_SetFlowControl(self._handle, value, 0, 0) != 0:
             raise FtdiError('Unable to set flow control')
 
     def set_dtr(self, state: bool) -> None:
@@ -1461,28 +1726,42 @@ class Ftdi:
 
            :param state: new DTR logical level
         """
+        state = bool(state)
+        if state == self._dtr_state:
+            return
+        self._dtr_state = None
         if state:
-            if self._d2xx.FT_SetDtr(self._handle) != 0:
+            if self._ft_set_dtr(self._handle) != 0:
                 raise FtdiError('Unable to set DTR line')
         else:
-            if self._d2xx.FT_ClrDtr(self._handle) != 0:
+            if self._ft_clr_dtr(self._handle) != 0:
                 raise FtdiError('Unable to set DTR line')
+        self._dtr_state = state
 
     def set_rts(self, state: bool) -> None:
         """Set rts line
 
            :param state: new RTS logical level
         """
+        state = bool(state)
+        if state == self._rts_state:
+            return
+        self._rts_state = None
         if state:
-            if self._d2xx.FT_SetRts(self._handle) != 0:
+            if self._ft_set_rts(self._handle) != 0:
                 raise FtdiError('Unable to set RTS line')
         else:
-            if self._d2xx.FT_ClrRts(self._handle) != 0:
+            if self._ft_clr_rts(self._handle) != 0:
                 raise FtdiError('Unable to set RTS line')
+        self._rts_state = state
 
     def set_dtr_rts(self, dtr: bool, rts: bool) -> None:
         """Set dtr and rts lines at once
 
+           D2XX has no request to change both lines at once, however lines
+           which already are at the requested level are left untouched, so
+           at most one request is issued when a single line changes.
+
            :param dtr: new DTR logical level
            :param rts: new RTS logical level
         """
@@ -1501,23 +1780,38 @@ class Ftdi:
             if self._d2xx.FT_SetBreakOff(self._handle) != 0:
                 raise FtdiError('Unable to stop break sequence')
 
+    def set_chars(self, eventch: int, event_enable: bool,
+                  errorch: int, error_enable: bool) -> None:
+        """Set both the special event and error characters at once.
+
+           The request is skipped if the device already uses these settings.
+
+           :param eventch: the event character
+           :param event_enable: whether to enable the event character
+           :param errorch: the error character
+           :param error_enable: whether to enable the error character
+        """
+        self._event_char = eventch
+        self._event_char_enabled = event_enable
+        self._error_char = errorch
+        self._error_char_enabled = error_enable
+        chars = (eventch, bool(event_enable), errorch, bool(error_enable))
+        if chars == self._chars:
+            return
+        self._chars = None
+        if self._d2xx.FT_SetChars(self._handle, *chars) != 0:
+            raise FtdiError('Unable to set special chars')
+        self._chars = chars
+
     def set_event_char(self, eventch: int, enable: bool) -> None:
         """Set the special event character"""
-        self._event_char = eventch
-        self._event_char_enabled = enable
-        if self._d2xx.FT_SetChars(self._handle,
-                                  c_uint8(self._event_char), c_uint8(self._event_char_enabled),
-                                  c_uint8(self._error_char), c_uint8(self._error_char_enabled)) != 0:
-            raise FtdiError('Unable to set event char')
+        self.set_chars(eventch, enable,
+                       self._error_char, self._error_char_enabled)
 
     def set_error_char(self, errorch: int, enable: bool) -> None:
         """Set error character"""
-        self._error_char = errorch
-        self._error_char_enabled = enable
-        if self._d2xx.FT_SetChars(self._handle,
-                                  c_uint8(self._event_char), c_uint8(self._event_char_enabled),
-                                  c_uint8(self._error_char), c_uint8(self._error_char_enabled)) != 0:
-            raise FtdiError('Unable to set error char')
+        self.set_chars(self._event_char, self._event_char_enabled,
+                       errorch, enable)
 
     def set_line_property(self, bits: int, stopbit: Union[int, float],
                           parity: str, break_: bool = False) -> None:
@@ -1550,26 +1844,21 @@ class Ftdi:
            :param parity: parity mode as a single uppercase character
            :param break_: force break event
         """
-        bytelength = {7: Ftdi.BITS_7,
-                      8: Ftdi.BITS_8}
-        parities = {'N': Ftdi.PARITY_NONE,
-                    'O': Ftdi.PARITY_ODD,
-                    'E': Ftdi.PARITY_EVEN,
-                    'M': Ftdi.PARITY_MARK,
-                    'S': Ftdi.PARITY_SPACE}
-        stopbits = {1: Ftdi.STOP_BIT_1,
-                    1.5: Ftdi.STOP_BIT_15,
-                    2: Ftdi.STOP_BIT_2}
-        if parity not in parities:
-            raise FtdiFeatureError("Unsupported parity")
-        if bits not in bytelength:
-            raise FtdiFeatureError("Unsupported byte length")
-        if stopbit not in stopbits:
-            raise FtdiFeatureError("Unsupported stop bits")
-
-        if self._d2xx.FT_SetDataCharacteristics(self._handle,
-                                  c_uint8(bytelength[bits]), c_uint8(stopbits[stopbit]),
-                                  c_uint8(parities[parity])) != 0:
+        try:
+            parity = Ftdi._LINE_PARITIES[parity]
+        except KeyError:
+            raise FtdiFeatureError("Unsupported parity") from None
+        try:
+            bits = Ftdi._LINE_BITS[bits]
+        except KeyError:
+            raise FtdiFeatureError("Unsupported byte length") from None
+        try:
+            stopbit = Ftdi._LINE_STOP_BITS[stopbit]
+        except KeyError:
+            raise FtdiFeatureError("Unsupported stop bits") from None
+
+        if self._d2xx.FT_SetDataCharacteristics(self._handle, bits, stopbit,
+                                                parity) != 0:
             raise FtdiError('Unable to set line property')
         self.set_break(break_)
 
@@ -1585,8 +1874,7 @@ class Ftdi:
         if not self.is_mpsse:
             raise FtdiMpsseError('Setting adaptive clock mode is only '
                                  'available from MPSSE mode')
-        self.write_data(bytearray([enable and Ftdi.ENABLE_CLK_ADAPTIVE or
-                                   Ftdi.DISABLE_CLK_ADAPTIVE]))
+        self.write_data(Ftdi._ADAPTIVE_CLOCK_CMDS[bool(enable)])
 
     def enable_3phase_clock(self, enable: bool = True) -> None:
         """Enable 3-phase clocking mode, useful in MPSSE mode.
@@ -1604,8 +1892,7 @@ class Ftdi:
         if not self.is_H_series:
             raise FtdiFeatureError('This device does not support 3-phase '
                                    'clock')
-        self.write_data(bytearray([enable and Ftdi.ENABLE_CLK_3PHASE or
-                                   Ftdi.DISABLE_CLK_3PHASE]))
+        self.write_data(Ftdi._3PHASE_CLOCK_CMDS[bool(enable)])
 
     def enable_drivezero_mode(self, lines: int) -> None:
         """Enable drive-zero mode, useful in MPSSE mode.
@@ -1623,8 +1910,7 @@ class Ftdi:
         if not self.has_drivezero:
             raise FtdiFeatureError('This device does not support drive-zero '
                                    'mode')
-        self.write_data(bytearray([Ftdi.DRIVE_ZERO, lines & 0xff,
-                                   (lines >> 8) & 0xff]))
+        self.write_data(_MPSSE_WORD_CMD.pack(Ftdi.DRIVE_ZERO, lines & 0xffff))
 
     def enable_loopback_mode(self, loopback: bool = False) -> None:
         """Enable loopback, i.e. connect DO to DI in FTDI MPSSE port for test
@@ -1632,8 +1918,7 @@ class Ftdi:
 
            :param loopback: whether to enable or disable this mode
         """
-        self.write_data(bytearray((Ftdi.LOOPBACK_START if loopback else
-                                   Ftdi.LOOPBACK_END,)))
+        self.write_data(Ftdi._LOOPBACK_CMDS[bool(loopback)])
 
     def calc_eeprom_checksum(self, data: Union[bytes, bytearray]) -> int:
         """Calculate EEPROM checksum over the data
@@ -1650,14 +1935,16 @@ class Ftdi:
         # NOTE: checksum is computed using 16-bit values in little endian
         # ordering
         checksum = 0XAAAA
-        mtp = self.device_version == 0x1000  # FT230X
-        for idx in range(0, length, 2):
-            if mtp and 0x24 <= idx < 0x80:
-                # special MTP user section which is not considered for the CRC
-                continue
-            val = ((data[idx+1] << 8) + data[idx]) & 0xffff
-            checksum = val ^ checksum
-            checksum = ((checksum << 1) & 0xffff) | ((checksum >> 15) & 0xffff)
+        words = memoryview(data)
+        if self.device_version == 0x1000:  # FT230X
+            # special MTP user section which is not considered for the CRC
+            sections = (words[:0x24], words[0x80:])
+        else:
+            sections = (words,)
+        for section in sections:
+            for val, in _EEPROM_WORD.iter_unpack(section):
+                checksum ^= val
+                checksum = ((checksum << 1) | (checksum >> 15)) & 0xffff
         return checksum
 
     def read_eeprom(self, addr: int = 0, length: Optional[int] = None,
@@ -1681,15 +1968,18 @@ class Ftdi:
         word_count = length >> 1
         if (addr & 0x1) | (length & 0x1):
             word_count += 1
-        data = bytearray()
-        while word_count:
-            buf = c_uint16()
-            if self._d2xx.FT_ReadEE(self._handle, c_uint32(word_addr), byref(buf)) != 0:
+        # D2XX only provides raw EEPROM accesses one word at a time
+        ft_read_ee = self._d2xx.FT_ReadEE
+        data = bytearray(word_count << 1)
+        buf = c_uint16()
+        for offset in range(0, len(data), _EEPROM_WORD.size):
+            if ft_read_ee(self._handle, word_addr, buf) != 0:
                 raise FtdiEepromError('EEPROM read error @ %d' %
                                       (word_addr << 1))
-            data.extend(buf.value)
-            word_count -= 1
+            _EEPROM_WORD.pack_into(data, offset, buf.value)
             word_addr += 1
+        if not addr and length == eeprom_size:
+            self._eeprom_cache = data
         start = addr & 0x1
         return bytes(data[start:start+length])
 
@@ -1717,21 +2007,27 @@ class Ftdi:
             # accept up to eeprom_size, even if the last two bytes are
             # overwritten with a locally computed checksum
             raise ValueError('Invalid address/length')
-        # First, read out the entire EEPROM, based on eeprom_size.
-        eeprom = bytearray(self.read_eeprom(0, eeprom_size))
+        # FT230x checksum is not stored in the last word, which is always
+        # written back below, so the caller should provide it as well
+        full_size = eeprom_size if self.device_version == 0x1000 \
+            else eeprom_size-2
+        if addr == 0 and length >= full_size:
+            # the caller provides the whole content but the checksum, there
+            # is no need to read out the current EEPROM content
+            eeprom = bytearray(data)
+            eeprom.extend(bytes(eeprom_size-length))
+        # Otherwise, read out the entire EEPROM, based on eeprom_size, unless
+        # it is already known from a previous full read or write
+        elif self._eeprom_cache and len(self._eeprom_cache) == eeprom_size:
+            eeprom = bytearray(self._eeprom_cache)
+        else:
+            eeprom = bytearray(self.read_eeprom(0, eeprom_size))
         # patch in the new data
-        eeprom[addr:addr+len(data)] = data
+        eeprom[addr:addr+length] = data
         # compute new checksum
         chksum = self.calc_eeprom_checksum(eeprom[:-2])
         self.log.info('New EEPROM checksum: 0x%04x', chksum)
-        # insert updated checksum - it is last 16-bits in EEPROM
-        if self.device_version == 0x1000:
-            # FT230x EEPROM structure is different
-            eeprom[0x7e] = chksum & 0x0ff
-            eeprom[0x7f] = chksum >> 8
-        else:
-            eeprom[-2] = chksum & 0x0ff
-            eeprom[-1] = chksum >> 8
+        self._set_eeprom_checksum(eeprom, chksum)
         # Write back the new data and checksum back to
         # EEPROM. Only write data that is changing instead of writing
         # everything in EEPROM, even if the data does not change.
@@ -1754,6 +2050,18 @@ class Ftdi:
         # ... updated checksum
         self._write_eeprom_raw((eeprom_size-2), eeprom[-2:], dry_run=dry_run)
 
+    def _set_eeprom_checksum(self, eeprom: bytearray, chksum: int) -> None:
+        """Insert the checksum into an EEPROM image.
+
+           :param eeprom: the whole EEPROM content, updated in place
+           :param chksum: the checksum value
+        """
+        # checksum is the last 16-bits in EEPROM, except for FT230x whose
+        # EEPROM structure is different
+        pos = 0x7e if self.device_version == 0x1000 else len(eeprom)-2
+        eeprom[pos] = chksum & 0x0ff
+        eeprom[pos+1] = chksum >> 8
+
     def overwrite_eeprom(self, data: Union[bytes, bytearray],
                          dry_run: bool = True) -> None:
         """Write the whole EEPROM content, from first to last byte.
@@ -1785,21 +2093,59 @@ class Ftdi:
            Data buffer is split into chunk-sized blocks before being sent over
            the USB bus.
 
+           If the port is corked, see :py:meth:`cork`, data is only queued
+           until :py:meth:`uncork` is called or some data are read back.
+
            :param data: the byte stream to send to the FTDI interface
            :return: count of written bytes
         """
-        offset = 0
-        size = len(data)
-        while offset < size:
-            write_size = self._writebuffer_chunksize
-            if offset + write_size > size:
-                write_size = size - offset
-            length = self._write(data[offset:offset+write_size])
-            # print('WRITE', offset, size, length)
-            if length <= 0:
-                raise FtdiError("Usb bulk write error")
-            offset += length
-        return offset
+        if self._tx_cork is not None:
+            self._tx_cork.extend(data)
+            return len(data)
+        return self._write_data(data)
+
+    def cork(self) -> None:
+        """Start coalescing written data into a single USB transfer.
+
+           Subsequent :py:meth:`write_data` calls are accumulated in a local
+           buffer rather than being sent one by one to the FTDI device, which
+           saves USB round-trips for chatty MPSSE command sequences.
+
+           Pending data are flushed out before any read request, so that
+           commands expecting a reply are always sent first. They are also
+           flushed out before the control requests that depend on the data
+           stream order, i.e. bitmode changes, buffer purges, MPSSE
+           validation and clock changes, and on :py:meth:`close`. Other
+           control requests, such as modem line or latency settings, are
+           sent right away, ahead of any pending data.
+        """
+        if self._tx_cork is None:
+            self._tx_cork = bytearray()
+
+    def uncork(self) -> int:
+        """Stop coalescing written data and send all pending data at once.
+
+           :return: count of written bytes
+        """
+        pending = self._tx_cork
+        self._tx_cork = None
+        if not pending:
+            return 0
+        return self._write_data(pending)
+
+    @property
+    def is_corked(self) -> bool:
+        """Tell whether written data are currently coalesced.
+
+           :return: True if the port is corked
+        """
+        return self._tx_cork is not None
+
+    def _flush_cork(self) -> None:
+        """Send pending corked data, if any, keeping the port corked."""
+        if self._tx_cork:
+            self._write_data(self._tx_cork)
+            self._tx_cork.clear()
 
     def read_data_bytes(self, size: int, attempt: int = 1,
                         request_gen: Optional[Callable[[int], bytes]] = None) \
@@ -1837,60 +2183,51 @@ class Ftdi:
         # Packet size sanity check
         if not self._max_packet_size:
             raise FtdiError("max_packet_size is bogus")
-        packet_size = self._max_packet_size
+        # pending corked commands may be the ones triggering the reply
+        self._flush_cork()
         length = 1  # initial condition to enter the usb_read loop
-        data = bytearray()
-        # everything we want is still in the cache?
-        if size <= len(self._readbuffer)-self._readoffset:
-            data = self._readbuffer[self._readoffset:self._readoffset+size]
-            self._readoffset += size
+        # output buffer is allocated once, and filled in with slice
+        # assignments that never resize it
+        data = bytearray(size)
+        # consume what is still in the cache first
+        pos = min(size, len(self._readbuffer)-self._readoffset)
+        if pos:
+            data[:pos] = \
+                self._readbuffer[self._readoffset:self._readoffset+pos]
+            self._readoffset += pos
+        # everything we want was still in the cache, or nothing was wanted?
+        if pos == size:
             return data
-        # something still in the cache, but not enough to satisfy 'size'?
-        if len(self._readbuffer)-self._readoffset != 0:
-            data = self._readbuffer[self._readoffset:]
-            # end of readbuffer reached
-            self._readoffset = len(self._readbuffer)
         # read from USB, filling in the local cache as it is empty
         retry = attempt
         req_size = size
-        while (len(data) < size) and (length > 0):
+        while (pos < size) and (length > 0):
             while True:
-                tempbuf = self._read(size - len(data))
+                status, payload = self._read(size - pos, bool(request_gen))
                 retry -= 1
-                length = len(tempbuf)
+                length = len(payload)
+                if status[1] & self.TX_EMPTY_BITS:
+                    if request_gen:
+                        req_size -= length
+                        if req_size > 0:
+                            cmd = request_gen(req_size)
+                            if cmd:
+                                self.write_data(cmd)
                 # the received buffer contains at least one useful databyte
-                # (first 2 bytes in each packet represent the current modem
-                # status)
-                if length >= 2:
-                    if tempbuf[1] & self.TX_EMPTY_BITS:
-                        if request_gen:
-                            req_size -= length-2
-                            if req_size > 0:
-                                cmd = request_gen(req_size)
-                                if cmd:
-                                    self.write_data(cmd)
-                if length > 2:
+                if length > 0:
                     retry = attempt
                     if self._latency_threshold:
                         self._adapt_latency(True)
-                    # skip the status bytes
-                    chunks = (length+packet_size-1) // packet_size
-                    count = packet_size - 2
-                    # if you want to show status, use the following code:
-                    status = tempbuf[:2]
-                    if status[1] & self.ERROR_BITS[1]:
+                    if self.has_modem_error(status):
                         self.log.error(
                             'FTDI error: %02x:%02x %s',
                             status[0], status[1], (' '.join(
                                 self.decode_modem_status(status,
                                                          True)).title()))
-                    self._readbuffer = bytearray()
+                    # the cache is a view on the D2XX receive buffer, which
+                    # is only refilled once the cache has been drained
+                    self._readbuffer = payload
                     self._readoffset = 0
-                    srcoff = 2
-                    for _ in range(chunks):
-                        self._readbuffer += tempbuf[srcoff:srcoff+count]
-                        srcoff += packet_size
-                    length = len(self._readbuffer)
                     break
                 else:
                     # received buffer only contains the modem status bytes
@@ -1903,26 +2240,16 @@ class Ftdi:
                     if self._latency_threshold:
                         self._adapt_latency(False)
                     # no more data to read?
+                    del data[pos:]
                     return data
             if length > 0:
-                # data still fits in buf?
-                if (len(data) + length) <= size:
-                    data += self._readbuffer[self._readoffset:
-                                             self._readoffset+length]
-                    self._readoffset += length
-                    # did we read exactly the right amount of bytes?
-                    if len(data) == size:
-                        return data
-                else:
-                    # partial copy, not enough bytes in the local cache to
-                    # fulfill the request
-                    part_size = min(size-len(data),
-                                    len(self._readbuffer)-self._readoffset)
-                    if part_size < 0:
-                        raise FtdiError("Internal Error")
-                    data += self._readbuffer[self._readoffset:
-                                             self._readoffset+part_size]
-                    self._readoffset += part_size
+                # copy as much of the cache as the request can hold
+                part_size = min(size-pos, length)
+                data[pos:pos+part_size] = self._readbuffer[:part_size]
+                self._readoffset = part_size
+                pos += part_size
+                # did we read exactly the right amount of bytes?
+                if pos == size:
                     return data
         # never reached
         raise FtdiError("Internal error")
@@ -1943,32 +2270,38 @@ class Ftdi:
 
            :return: CTS line logical level
         """
-        status = self.poll_modem_status()
-        return bool(status & self.MODEM_CTS)
+        return bool(self.poll_modem_status() & self.MODEM_CTS)
 
     def get_dsr(self) -> bool:
         """Read terminal status line: Data Set Ready
 
            :return: DSR line logical level
         """
-        status = self.poll_modem_status()
-        return bool(status & self.MODEM_DSR)
+        return bool(self.poll_modem_status() & self.MODEM_DSR)
 
     def get_ri(self) -> bool:
         """Read terminal status line: Ring Indicator
 
            :return: RI line logical level
         """
-        status = self.poll_modem_status()
-        return bool(status & self.MODEM_RI)
+        return bool(self.poll_modem_status() & self.MODEM_RI)
 
     def get_cd(self) -> bool:
         """Read terminal status line: Carrier Detect
 
            :return: CD line logical level
         """
+        return bool(self.poll_modem_status() & self.MODEM_RLSD)
+
+    def get_modem_lines(self) -> Tuple[bool, bool, bool, bool]:
+        """Read all terminal status lines at once, with a single request to
+           the device.
+
+           :return: CTS, DSR, RI and CD lines logical levels
+        """
         status = self.poll_modem_status()
-        return bool(status & self.MODEM_RLSD)
+        return (bool(status & self.MODEM_CTS), bool(status & self.MODEM_DSR),
+                bool(status & self.MODEM_RI), bool(status & self.MODEM_RLSD))
 
     def set_dynamic_latency(self, lmin: int, lmax: int,
                             threshold: int) -> None:
@@ -2011,6 +2344,16 @@ class Ftdi:
             self._latency = lmin
             self.set_latency_timer(self._latency)
 
+    def get_rx_queue_size(self) -> int:
+        """Report how many received bytes are pending in the driver.
+
+           :return: the count of bytes that can be read without waiting
+        """
+        count = c_uint32()
+        if self._ft_get_queue_status(self._handle, count) != 0:
+            raise FtdiError('Unable to get queue status')
+        return count.value
+
     def validate_mpsse(self) -> None:
         """Check that the previous MPSSE request has been accepted by the FTDI
            device.
@@ -2018,12 +2361,10 @@ class Ftdi:
            :raise FtdiError: if the FTDI device rejected the command.
         """
         # only useful in MPSSE mode
-        num_avail = c_uint32(0)
-        if self._d2xx.FT_GetQueueStatus(self._handle, byref(num_avail)) != 0:
-            raise FtdiError('Unable to check MPSSE response') from None
-        if num_avail.value > 0:
+        self._flush_cork()
+        if self.get_rx_queue_size() > 0:
             bytes_ = self.read_data(2)
-            if (len(bytes_) >= 2) and (bytes_[0] == '\xfa'):
+            if (len(bytes_) >= 2) and (bytes_[0] == 0xFA):
                 raise FtdiError("Invalid command @ %d" % bytes_[1])
 
     @classmethod
@@ -2040,35 +2381,128 @@ class Ftdi:
         """Select the interface to use on the FTDI device"""
         raise NotImplementedError()
 
+    def _set_device_characteristics(self, version: int) -> None:
+        """Evaluate once the features of the device from its version, so
+           that the feature properties do not need to."""
+        if version in (0x0700, 0x0900):
+            self._port_width = 16
+        elif version == 0x0500:
+            self._port_width = 12
+        else:
+            self._port_width = 8
+        self._has_wide_port = self._port_width > 8
+        self._has_mpsse = version in (0x0500, 0x0700, 0x0800, 0x0900)
+        self._has_cbus = version in (0x0600, 0x0900, 0x1000)
+        self._has_drivezero = version == 0x0900
+        self._is_legacy = version <= 0x0200
+        self._is_H_series = version in (0x0700, 0x0800, 0x0900)
+        self._fifo_sizes = self.FIFO_SIZES.get(version)
+        self._ic_name = self.DEVICE_NAMES.get(version, 'undefined')
+        self._port_count = self.PORT_COUNTS.get(version, 0)
+        self._frequency_max = self.BUS_CLOCK_HIGH if self._is_H_series \
+            else self.BUS_CLOCK_BASE
+        self._convert_baudrate = self._convert_baudrate_legacy \
+            if version == 0x0200 else self._convert_baudrate_fractional
+
     def _reset_usb_device(self) -> None:
         """Reset USB device (USB command, not FTDI specific)."""
         if self._d2xx.FT_CyclePort(self._handle) != 0:
             raise FtdiError('Unable to cycle port on FTDI device')
+        self._dtr_state = self._rts_state = None
 
     def _reset_device(self):
         """Reset the FTDI device (FTDI vendor command)"""
         if self._d2xx.FT_ResetDevice(self._handle) != 0:
             raise FtdiError('Unable to reset FTDI device')
+        self._dtr_state = self._rts_state = None
+        self._chars = None
 
     def _update_timeouts(self) -> None:
         """Update the read and write timeouts."""
-        if self._d2xx.FT_SetTimeouts(self._handle, c_uint32(self._usb_read_timeout), c_uint32(self._usb_write_timeout)) != 0:
+        if self._d2xx.FT_SetTimeouts(self._handle, self._usb_read_timeout,
+                                     self._usb_write_timeout) != 0:
             raise FtdiError('Unable to set read/write timeouts')
 
+    def _write_data(self, data: Union[bytes, bytearray]) -> int:
+        """Send data to the FTDI port, in chunk-sized blocks."""
+        offset = 0
+        size = len(data)
+        if size > self._writebuffer_chunksize:
+            # chunks of writable buffers are then shared with D2XX, not copied
+            try:
+                data = memoryview(data)
+            except TypeError:
+                # not a buffer, such as a sequence of integers
+                data = bytes(data)
+        while offset < size:
+            write_size = self._writebuffer_chunksize
+            if offset + write_size > size:
+                write_size = size - offset
+            if not offset and write_size == size:
+                length = self._write(data)
+            else:
+                length = self._write(data[offset:offset+write_size])
+            # print('WRITE', offset, size, length)
+            if length <= 0:
+                raise FtdiError("Usb bulk write error")
+            offset += length
+        return offset
+
     def _write(self, data: Union[bytes, bytearray]) -> int:
         if self._debug_log:
             try:
-                self.log.debug('> %s', hexlify(data).decode())
+                self.log.debug('> %s', memoryview(data).hex())
             except TypeError as exc:
                 self.log.warning('> (invalid output byte sequence: %s)', exc)
         if self._tracer:
             self._tracer.send(self._index, data)
-        num_written = c_uint32()
-        if self._d2xx.FT_Write(self._handle, create_string_buffer(bytes(data)), c_uint32(len(data)), byref(num_written)) != 0:
+        if isinstance(data, bytes):
+            # immutable bytes are handed over as a char pointer, w/o copy
+            buf = data
+            size = len(data)
+        else:
+            try:
+                view = memoryview(data)
+            except TypeError:
+                # not a buffer, such as a sequence of integers
+                view = memoryview(bytes(data))
+            size = view.nbytes
+            if view.readonly or not view.c_contiguous:
+                buf = view.tobytes()
+            else:
+                # share any writable buffer (bytearray, array, memoryview)
+                buf = (c_uint8 * size).from_buffer(view)
+        if self._ft_write(self._handle, buf, size, self._c_write_count) != 0:
             raise FtdiError('Write Failed') from None
-        return num_written.value
+        return self._c_write_count.value
 
-    def _read(self, size: int) -> bytearray:
+    def _poll_modem_status(self) -> None:
+        """Query the modem status, and record how long it remains current.
+        """
+        if self._ft_get_modem_status(self._handle, self._c_status) != 0:
+            raise FtdiError('Unable to get modem status')
+        # the device does not report a new status any faster
+        self._status_expiry = \
+            monotonic() + (self._latency_timer or self.LATENCY_MIN) / 1000
+
+    def _read(self, size: int, refresh_status: bool = False) -> \
+            Tuple[bytes, memoryview]:
+        """Read data from the FTDI port.
+
+           Modem status is queried whenever a payload is received, as its
+           line status bits are then checked for errors, or when the caller
+           needs an up-to-date status. Otherwise it is only queried once per
+           latency timer period, and the last known status is reported, which
+           spares one D2XX request per empty read.
+
+           Received bytes are not copied: they are returned as a view on
+           the receive buffer, which is only valid till the next call.
+
+           :param size: the maximum count of bytes to read
+           :param refresh_status: whether to always query the modem status
+           :return: a 2-uple of the 2-byte modem status and the received
+                    bytes
+        """
         #num_avail = c_uint32(0)
         #if self._d2xx.FT_GetQueueStatus(self._handle, byref(num_avail)) != 0:
         #    raise FtdiError('Unable to read') from None
@@ -2080,25 +2514,34 @@ class Ftdi:
         #    if self._d2xx.FT_Read(self._handle, byref(self._raw_readbuffer), num_avail, byref(num_read)) != 0:
         #        raise FtdiError('Unable to read') from None
 
-        num_read = c_uint32(0);
-        if self._d2xx.FT_Read(self._handle, byref(self._raw_readbuffer), c_uint32(size), byref(num_read)) != 0:
+        # D2XX driver keeps its own bulk IN requests queued (see transfer
+        # size in open_from_device), so the endpoint is never left idle in
+        # between two calls: there is no need for a reader thread. Never
+        # request more than the raw buffer can hold though.
+        size = min(size, len(self._raw_readbuffer))
+        # commands queued while corked, such as the ones from a read request
+        # generator, may be the ones triggering the expected reply
+        self._flush_cork()
+        # out parameters are declared as pointers in the D2XX prototypes,
+        # ctypes passes them by reference on its own
+        if self._ft_read(self._handle, self._raw_readbuffer, size,
+                         self._c_read_count) != 0:
             raise FtdiError('Unable to read') from None
+        num_read = self._c_read_count.value
 
-        value = c_uint32()
-        if self._d2xx.FT_GetModemStatus(self._handle, byref(value)) != 0:
-            raise FtdiError('Unable to read')
+        if refresh_status or num_read or monotonic() >= self._status_expiry:
+            self._poll_modem_status()
+        value = self._c_status.value
 
-        data = bytearray()
-        data.extend( [value.value & 0xFF, (value.value >> 8) & 0xFF] )
-        if num_read.value > 0:
-            data.extend( self._raw_readbuffer[:num_read.value] )
+        status = bytes((value & 0xFF, (value >> 8) & 0xFF))
+        # slicing the ctypes array would build a list of int objects
+        payload = memoryview(self._rx_buffer)[:num_read]
 
-        if len(data) > 0:
-            if self._debug_log:
-                self.log.debug('< %s', hexlify(data).decode())
-            if self._tracer and len(data) > 2:
-                self._tracer.receive(self._index, data[2:])
-        return data
+        if self._debug_log:
+            self.log.debug('< %s%s', status.hex(), payload.hex())
+        if self._tracer and num_read:
+            self._tracer.receive(self._index, payload)
+        return status, payload
 
     def _adapt_latency(self, payload_detected: bool) -> None:
         """Dynamic latency adaptation depending on the presence of a
@@ -2162,15 +2605,29 @@ class Ftdi:
             length = len(data)
             if addr & 0x1 or length & 0x1:
                 raise ValueError('Address/length not even')
-            for word in sunpack('<%dH' % (length//2), data):
+            # the cached EEPROM content is only valid once the whole write
+            # has completed
+            cache, self._eeprom_cache = self._eeprom_cache, None
+            if cache and addr+length > len(cache):
+                cache = None
+            for word, in _EEPROM_WORD.iter_unpack(data):
+                if cache and not dry_run and \
+                        _EEPROM_WORD.unpack_from(cache, addr)[0] == word:
+                    # D2XX has no raw block write, spare unneeded requests
+                    addr += 2
+                    continue
                 if not dry_run:
-                    if self._d2xx.FT_WriteEE(self._handle, c_uint32(addr >> 1), c_uint16(word)) != 0:
+                    if self._d2xx.FT_WriteEE(self._handle, addr >> 1,
+                                             word) != 0:
                         raise FtdiEepromError('EEPROM Write Error @ %d' % addr)
                     self.log.debug('Write EEPROM [0x%02x]: 0x%04x', addr, word)
+                    if cache:
+                        _EEPROM_WORD.pack_into(cache, addr, word)
                 else:
                     self.log.info('Fake write EEPROM [0x%02x]: 0x%04x',
                                   addr, word)
                 addr += 2
+            self._eeprom_cache = cache
         finally:
             if latency:
                 self.set_latency_timer(latency)
@@ -2185,80 +2642,116 @@ class Ftdi:
     def _convert_baudrate_legacy(self, baudrate: int) -> Tuple[int, int, int]:
         if baudrate > self.BAUDRATE_REF_BASE:
             raise ValueError('Invalid baudrate (too high)')
-        div8 = int(round((8 * self.BAUDRATE_REF_BASE) / baudrate))
+        div, estimate = self._compute_legacy_divisor(self.BAUDRATE_REF_BASE,
+                                                     baudrate)
+        value = div & 0xFFFF
+        index = (div >> 16) & 0xFFFF
+        return estimate, value, index
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _compute_legacy_divisor(clock: int, baudrate: int) -> \
+            Tuple[int, int]:
+        """Compute the divisor to generate a baudrate on legacy devices,
+           which only support a subset of the fractional divisors.
+
+           :param clock: the baudrate reference clock in Hz
+           :param baudrate: the baudrate to generate, in bps
+           :return: a 2-uple of the divisor and the achievable baudrate
+        """
+        # baudrate may be given as a float, integer math is required here
+        baudrate = int(baudrate)
+        div8 = ((clock << 3) + (baudrate >> 1)) // baudrate
         if (div8 & 0x7) == 7:
             div8 += 1
         div = div8 >> 3
-        div8 &= 0x7
-        if div8 == 1:
+        frac = div8 & 0x7
+        if frac == 1:
             div |= 0xc000
-        elif div8 >= 4:
+        elif frac >= 4:
             div |= 0x4000
-        elif div8 != 0:
+            frac = 4
+        elif frac != 0:
             div |= 0x8000
+            frac = 2
         elif div == 1:
             div = 0
-        value = div & 0xFFFF
-        index = (div >> 16) & 0xFFFF
-        estimate = int(((8 * self.BAUDRATE_REF_BASE) + (div8//2))//div8)
-        return estimate, value, index
+        # estimate from the fraction actually encoded: 0, 1/8, 1/4 or 1/2
+        div8 = (div8 & ~0x7) | frac
+        estimate = ((clock << 3) + (div8 >> 1)) // div8
+        return div, estimate
 
-    def _convert_baudrate(self, baudrate: int) -> Tuple[int, int, int]:
+    def _convert_baudrate_fractional(self, baudrate: int) -> \
+            Tuple[int, int, int]:
         """Convert a requested baudrate into the closest possible baudrate
-           that can be assigned to the FTDI device
+           that can be assigned to the FTDI device.
+
+           The device-specific flavour is bound as ``_convert_baudrate``
+           when the device is opened, see
+           :py:meth:`_set_device_characteristics`.
 
            :param baudrate: the baudrate in bps
            :return: a 3-uple of the apprimated baudrate, the value and index
                     to use as the USB configuration parameter
         """
-        if self.device_version == 0x200:
-            return self._convert_baudrate_legacy(baudrate)
-        if self.is_H_series and baudrate >= 1200:
-            hispeed = True
-            clock = self.BAUDRATE_REF_HIGH
-            bb_ratio = self.BITBANG_BAUDRATE_RATIO_HIGH
-        else:
-            hispeed = False
-            clock = self.BAUDRATE_REF_BASE
-            bb_ratio = self.BITBANG_BAUDRATE_RATIO_BASE
+        clock, bb_ratio, hispeed = \
+            Ftdi._BAUDRATE_CLOCKS[self._is_H_series and baudrate >= 1200]
         if baudrate > clock:
             raise ValueError('Invalid baudrate (too high)')
         if baudrate < ((clock >> 14) + 1):
             raise ValueError('Invalid baudrate (too low)')
         if self.is_bitbang_enabled:
             baudrate //= bb_ratio
-        div8 = int(round((8 * clock) / baudrate))
-        div = div8 >> 3
-        div |= self.FRAC_DIV_CODE[div8 & 0x7] << 14
-        if div == 1:
-            div = 0
-        elif div == 0x4001:
-            div = 1
-        if hispeed:
-            div |= 0x00020000
+        div, estimate = self._compute_divisor(clock, baudrate)
+        div |= hispeed
         value = div & 0xFFFF
         index = (div >> 16) & 0xFFFF
         if self.has_mpsse:
             index <<= 8
             index |= self._index
-        estimate = int(((8 * clock) + (div8//2))//div8)
         if self.is_bitbang_enabled:
             estimate *= bb_ratio
         return estimate, value, index
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _compute_divisor(clock: int, baudrate: int) -> Tuple[int, int]:
+        """Compute the fractional divisor to generate a baudrate.
+
+           Results only depend on the arguments, and applications keep
+           switching between a handful of baudrates, so they are memoized.
+
+           :param clock: the baudrate reference clock in Hz
+           :param baudrate: the baudrate to generate, in bps
+           :return: a 2-uple of the divisor and the achievable baudrate
+        """
+        # baudrate may be given as a float, integer math is required here
+        baudrate = int(baudrate)
+        div8 = ((clock << 3) + (baudrate >> 1)) // baudrate
+        div = div8 >> 3
+        div |= Ftdi.FRAC_DIV_CODE[div8 & 0x7] << 14
+        if div == 1:
+            div = 0
+        elif div == 0x4001:
+            div = 1
+        estimate = ((clock << 3) + (div8 >> 1)) // div8
+        return div, estimate
+
     def _set_baudrate(self, baudrate: int, constrain: bool) -> int:
         if self.is_mpsse:
             raise FtdiFeatureError('Cannot change frequency w/ current mode')
         actual, value, index = self._convert_baudrate(baudrate)
-        delta = 100*abs(float(actual-baudrate))/baudrate
-        self.log.debug('Actual baudrate: %d %.1f%% div [%04x:%04x]',
-                       actual, delta, index, value)
-        # return actual
-        if constrain and delta > Ftdi.BAUDRATE_TOLERANCE:
+        diff = abs(actual-baudrate)
+        if self._debug_log:
+            self.log.debug('Actual baudrate: %d %.1f%% div [%04x:%04x]',
+                           actual, 100*diff/baudrate, index, value)
+        # compare scaled values rather than dividing, the percentage is only
+        # worth computing for reporting
+        if constrain and 100*diff > Ftdi.BAUDRATE_TOLERANCE*baudrate:
             raise ValueError('Baudrate tolerance exceeded: %.02f%% '
                              '(wanted %d, achievable %d)' %
-                             (delta, baudrate, actual))
-        if self._d2xx.FT_SetBaudRate(self._handle, c_uint32(actual)) != 0:
+                             (100*diff/baudrate, baudrate, actual))
+        if self._d2xx.FT_SetBaudRate(self._handle, actual) != 0:
             raise FtdiError('Unable to set baudrate')
         return actual
 
@@ -2268,6 +2761,51 @@ class Ftdi:
             raise FtdiFeatureError('Cannot change frequency w/ current mode')
         if frequency > self.frequency_max:
             raise FtdiFeatureError('Unsupported frequency: %f' % frequency)
+        divcode, divisor, actual_freq, error = \
+            self._compute_tck_divisor(frequency, self.is_H_series)
+        cmd = _MPSSE_WORD_CMD.pack(Ftdi.SET_TCK_DIVISOR, divisor)
+        if self.is_H_series:
+            cmd = bytes((divcode,)) + cmd
+        self.write_data(cmd)
+        self._flush_cork()
+        # clock commands send no reply: whatever is pending in the input
+        # queue is either an invalid command report or stale data, to be
+        # discarded along with the local cache. Spare the purge request when
+        # nothing is pending in the driver
+        self._readoffset = 0
+        self._readbuffer = bytearray()
+        pending = self.get_rx_queue_size()
+        if pending > 0:
+            # only inspect what the driver received, not older cached data
+            _, reply = self._read(pending)
+            invalid = (len(reply) >= 2) and (reply[0] == 0xFA)
+            opcode = reply[1] if invalid else 0
+            self.purge_rx_buffer()
+            if invalid:
+                raise FtdiError("Invalid command @ %d" % opcode)
+        # Note that bus frequency may differ from clock frequency, when
+        # 3-phase clock is enable, in which case bus frequency = 2/3 clock
+        # frequency
+        if self._debug_log:
+            if actual_freq > 1E6:
+                self.log.debug('Clock frequency: %.6f MHz (error: %+.1f %%)',
+                               (actual_freq/1E6), error*100)
+            else:
+                self.log.debug('Clock frequency: %.3f KHz (error: %+.1f %%)',
+                               (actual_freq/1E3), error*100)
+        return actual_freq
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compute_tck_divisor(frequency: float, hispeed: bool) -> \
+            Tuple[int, int, float, float]:
+        """Compute the MPSSE clock divisor to generate a frequency.
+
+           :param frequency: the clock frequency to generate, in Hz
+           :param hispeed: whether the high speed clock is available
+           :return: a 4-uple of the clock divider command, the divisor, the
+                    achievable frequency and the relative error
+        """
         # Calculate base speed clock divider
         divcode = Ftdi.ENABLE_CLK_DIV5
         divisor = int((Ftdi.BUS_CLOCK_BASE+frequency/2)/frequency)-1
@@ -2275,7 +2813,7 @@ class Ftdi:
         actual_freq = Ftdi.BUS_CLOCK_BASE/(divisor+1)
         error = (actual_freq/frequency)-1
         # Should we use high speed clock available in H series?
-        if self.is_H_series:
+        if hispeed:
             # Calculate high speed clock divider
             divisor_hs = int((Ftdi.BUS_CLOCK_HIGH+frequency/2)/frequency)-1
             divisor_hs = max(0, min(0xFFFF, divisor_hs))
@@ -2287,27 +2825,7 @@ class Ftdi:
                 divisor = divisor_hs
                 actual_freq = actual_freq_hs
                 error = error_hs
-        # FTDI expects little endian
-        if self.is_H_series:
-            cmd = bytearray((divcode,))
-        else:
-            cmd = bytearray()
-        cmd.extend((Ftdi.SET_TCK_DIVISOR, divisor & 0xff,
-                    (divisor >> 8) & 0xff))
-        self.write_data(cmd)
-        self.validate_mpsse()
-        # Drain input buffer
-        self.purge_rx_buffer()
-        # Note that bus frequency may differ from clock frequency, when
-        # 3-phase clock is enable, in which case bus frequency = 2/3 clock
-        # frequency
-        if actual_freq > 1E6:
-            self.log.debug('Clock frequency: %.6f MHz (error: %+.1f %%)',
-                           (actual_freq/1E6), error*100)
-        else:
-            self.log.debug('Clock frequency: %.3f KHz (error: %+.1f %%)',
-                           (actual_freq/1E3), error*100)
-        return actual_freq
+        return divcode, divisor, actual_freq, error
 
     def __get_timeouts(self) -> Tuple[int, int]:
         return self._usb_read_timeout, self._usb_write_timeout
@@ -2322,13 +2840,28 @@ class Ftdi:
     timeouts = property(__get_timeouts, __set_timeouts)
 
     @classmethod
+    @lru_cache(maxsize=1)
     def _load_backend(cls):
+        """Load the D2XX library.
+
+           Locating and loading the DLL is costly, and the library is shared
+           by all the devices, so it is only loaded once.
+        """
         libname = ctypes.util.find_library("FTD2XX.dll")
         if not libname:
-            _LOGGER.error('FTD2XX.DLL could not be found')
+            getLogger('pyftdi.ftdi').error('FTD2XX.DLL could not be found')
             raise FtdiLibraryNotFoundException("FTD2XX.DLL")
         try:
-            return ctypes.WinDLL(libname)
-        except Exception:
-            _LOGGER.error(libname + ' could not be loaded', exc_info=True)
-            return None
+            d2xx = ctypes.WinDLL(libname)
+        except Exception as exc:
+            getLogger('pyftdi.ftdi').error('%s could not be loaded', libname,
+                                           exc_info=True)
+            raise FtdiLibraryNotFoundException(libname) from exc
+        # declare the prototypes of the frequently used functions, so that
+        # ctypes does not need to guess how to convert each argument, and
+        # callers may pass plain Python integers
+        for name, argtypes in _D2XX_PROTOTYPES.items():
+            func = getattr(d2xx, name)
+            func.argtypes = argtypes
+            func.restype = c_uint32
+        return d2xx
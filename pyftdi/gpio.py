@@ -8,7 +8,7 @@
 
 #pylint: disable-msg=too-few-public-methods
 
-from struct import calcsize as scalc, unpack as sunpack
+from struct import pack as spack, unpack as sunpack
 from typing import Iterable, Optional, Tuple, Union
 from .ftdi import Ftdi, FtdiError
 from .misc import is_iterable
@@ -268,9 +268,8 @@ class GpioAsyncController(GpioBaseController):
             else:
                 if not is_iterable(out):
                     raise TypeError('Invalid output value')
-            for val in out:
-                if val > self._mask:
-                    raise ValueError('Invalid output value')
+            if max(out, default=0) > self._mask:
+                raise ValueError('Invalid output value')
             out = bytes(out)
         self._ftdi.write_data(out)
 
@@ -371,9 +370,8 @@ class GpioSyncController(GpioBaseController):
                 out = bytes([out])
             elif not is_iterable(out):
                 raise TypeError('Invalid output value')
-            for val in out:
-                if val > self._mask:
-                    raise GpioException("Invalid value")
+            if max(out, default=0) > self._mask:
+                raise GpioException("Invalid value")
         self._ftdi.write_data(out)
         data = self._ftdi.read_data_bytes(len(out), 4)
         return data
@@ -428,6 +426,9 @@ class GpioMpsseController(GpioBaseController):
 
     MPSSE_PAYLOAD_MAX_LENGTH = 0xFF00  # 16 bits max (- spare for control)
 
+    _GET_BITS_CMD = bytes((Ftdi.GET_BITS_LOW,))
+    _GET_WIDE_BITS_CMD = bytes((Ftdi.GET_BITS_LOW, Ftdi.GET_BITS_HIGH))
+
     def read(self, readlen: int = 1, peek: Optional[bool] = None) -> \
              Union[int, bytes, Tuple[int]]:
         """Read the GPIO input pin electrical level.
@@ -470,9 +471,8 @@ class GpioMpsseController(GpioBaseController):
                 out = [out]
             elif not is_iterable(out):
                 raise TypeError('Invalid output value')
-            for val in out:
-                if val > self._mask:
-                    raise GpioException("Invalid value")
+            if max(out, default=0) > self._mask:
+                raise GpioException("Invalid value")
         self._write_mpsse(out)
 
     def set_frequency(self, frequency: Union[int, float]) -> None:
@@ -493,41 +493,58 @@ class GpioMpsseController(GpioBaseController):
                                                    **kwargs)
         self._width = self._ftdi.port_width
         self._mask = (1 << self._width) - 1
+        # the port width is now fixed, select the matching command builder
+        self._write_mpsse = self._write_mpsse_wide if self._width > 8 \
+            else self._write_mpsse_narrow
         self._direction = direction & self._mask
         return frequency
 
     def _read_mpsse(self, count: int) -> Tuple[int]:
-        if self._width > 8:
-            cmd = bytearray([Ftdi.GET_BITS_LOW, Ftdi.GET_BITS_HIGH] * count)
-            fmt = '<%dH' % count
+        wide = self._width > 8
+        if wide:
+            cmd = bytearray(self._GET_WIDE_BITS_CMD * count)
+            size = 2 * count
         else:
-            cmd = bytearray([Ftdi.GET_BITS_LOW] * count)
-            fmt = None
+            cmd = bytearray(self._GET_BITS_CMD * count)
+            size = count
         cmd.append(Ftdi.SEND_IMMEDIATE)
         if len(cmd) > self.MPSSE_PAYLOAD_MAX_LENGTH:
             raise ValueError('Too many samples')
         self._ftdi.write_data(cmd)
-        size = scalc(fmt) if fmt else count
         data = self._ftdi.read_data_bytes(size, 4)
         if len(data) != size:
             raise FtdiError('Cannot read GPIO, recv %d out of %d bytes' %
                             (len(data), size))
-        if fmt:
-            return sunpack(fmt, data)
+        if wide:
+            return sunpack('<%dH' % count, data)
         return data
 
-    def _write_mpsse(self,
-                     out: Union[bytes, bytearray, Iterable[int], int]) -> None:
-        cmd = []
+    def _write_mpsse_narrow(self, out: Union[bytes, bytearray,
+                                             Iterable[int]]) -> None:
+        # build the command stream with strided slice assignments, one per
+        # command column, rather than appending each sample in turn
         low_dir = self._direction & 0xFF
-        if self._width > 8:
-            high_dir = (self._direction >> 8) & 0xFF
-            for data in out:
-                low_data = data & 0xFF
-                high_data = (data >> 8) & 0xFF
-                cmd.extend([Ftdi.SET_BITS_LOW, low_data, low_dir,
-                            Ftdi.SET_BITS_HIGH, high_data, high_dir])
-        else:
-            for data in out:
-                cmd.extend([Ftdi.SET_BITS_LOW, data, low_dir])
-        self._ftdi.write_data(bytes(cmd))
+        data = bytes(out)
+        count = len(data)
+        cmd = bytearray(3 * count)
+        cmd[0::3] = bytes((Ftdi.SET_BITS_LOW,)) * count
+        cmd[1::3] = data
+        cmd[2::3] = bytes((low_dir,)) * count
+        self._ftdi.write_data(cmd)
+
+    def _write_mpsse_wide(self, out: Union[bytes, bytearray,
+                                           Iterable[int]]) -> None:
+        low_dir = self._direction & 0xFF
+        high_dir = (self._direction >> 8) & 0xFF
+        if not isinstance(out, (bytes, bytearray)):
+            out = tuple(out)
+        count = len(out)
+        data = spack('<%dH' % count, *out)
+        cmd = bytearray(6 * count)
+        cmd[0::6] = bytes((Ftdi.SET_BITS_LOW,)) * count
+        cmd[1::6] = data[0::2]
+        cmd[2::6] = bytes((low_dir,)) * count
+        cmd[3::6] = bytes((Ftdi.SET_BITS_HIGH,)) * count
+        cmd[4::6] = data[1::2]
+        cmd[5::6] = bytes((high_dir,)) * count
+        self._ftdi.write_data(cmd)
@@ -14,9 +14,8 @@
 #pylint: disable-msg=too-many-statements
 
 
-from binascii import hexlify
 from collections import namedtuple
-from logging import getLogger
+from logging import getLogger, DEBUG
 from struct import calcsize as scalc, pack as spack, unpack as sunpack
 from threading import Lock
 from typing import Any, Iterable, Mapping, Optional, Tuple, Union
@@ -861,7 +860,8 @@ class I2cController:
                     size = scalc(fmt)
                     self._do_prolog(i2caddress)
                     data = self._do_read(size)
-                    self.log.debug("Poll data: %s", hexlify(data).decode())
+                    if self.log.isEnabledFor(DEBUG):
+                        self.log.debug("Poll data: %s", data.hex())
                     cond, = sunpack(fmt, data)
                     if (cond & mask) == value:
                         self.log.debug('Poll condition matched')
@@ -1136,8 +1136,9 @@ class I2cController:
                     size = rem
                 self._ftdi.write_data(cmd)
                 buf = self._ftdi.read_data_bytes(size, 4)
-                self.log.debug('- read %d byte(s): %s',
-                               len(buf), hexlify(buf).decode())
+                if self.log.isEnabledFor(DEBUG):
+                    self.log.debug('- read %d byte(s): %s',
+                                   len(buf), buf.hex())
                 chunks.append(buf)
                 rem -= size
         return bytearray(b''.join(chunks))
@@ -1147,8 +1148,9 @@ class I2cController:
             out = bytearray(out)
         if not out:
             return
-        self.log.debug('- write %d byte(s): %s',
-                       len(out), hexlify(out).decode())
+        if self.log.isEnabledFor(DEBUG):
+            self.log.debug('- write %d byte(s): %s',
+                           len(out), out.hex())
         for byte in out:
             cmd = bytearray(self._write_byte)
             cmd.append(byte)
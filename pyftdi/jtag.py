@@ -182,7 +182,7 @@ class JtagController:
         self.direction = (JtagController.TCK_BIT |
                           JtagController.TDI_BIT |
                           JtagController.TMS_BIT |
-                          (self._trst and JtagController.TRST_BIT or 0))
+                          (JtagController.TRST_BIT if self._trst else 0))
         self._last = None  # Last deferred TDO bit
         self._write_buff = bytearray()
 
@@ -147,8 +147,7 @@ class FtdiSerial(SerialBase):
     @property
     def in_waiting(self):
         """Return the number of characters currently in the input buffer."""
-        # not implemented
-        return 0
+        return self.udev.get_rx_queue_size()
 
     @property
     def out_waiting(self):
@@ -146,8 +146,19 @@ class DisconnectTestCase(TestCase):
         ftdi.close()
 
 
+class ReadTestCase(TestCase):
+    """Read path checks that do not require an FTDI device."""
+
+    def test_empty_read(self):
+        """Validate that a zero-length read returns an empty buffer."""
+        ftdi = Ftdi()
+        ftdi._max_packet_size = 64
+        self.assertEqual(ftdi.read_data_bytes(0), b'')
+
+
 def suite():
     suite_ = TestSuite()
+    suite_.addTest(makeSuite(ReadTestCase, 'test'))
     #suite_.addTest(makeSuite(FtdiTestCase, 'test'))
     #suite_.addTest(makeSuite(HotplugTestCase, 'test'))
     suite_.addTest(makeSuite(ResetTestCase, 'test'))
@@ -8,7 +8,6 @@
 #pylint: disable-msg=missing-docstring
 #pylint: disable-msg=too-many-instance-attributes
 
-from binascii import hexlify
 from collections import deque
 from inspect import currentframe
 from logging import getLogger
@@ -134,7 +133,7 @@ class FtdiMpsseEngine:
             self._last_codes.clear()
 
     def receive(self, buf: Union[bytes, bytearray]) -> None:
-        self.log.info(' .. %s', hexlify(buf).decode())
+        self.log.info(' .. %s', buf.hex())
         self._trace_rx.extend(buf)
         while self._trace_rx:
             code = None
@@ -379,7 +378,7 @@ class FtdiMpsseEngine:
         funcname = caller[5:].title().replace('_', '')
         self.log.info(' [%d]:%s> (%d) %s',
                       self._if, funcname, length,
-                      hexlify(payload).decode('utf8'))
+                      payload.hex())
         self._trace_tx[:] = self._trace_tx[3+length:]
         return True
 
@@ -428,7 +427,7 @@ class FtdiMpsseEngine:
         self._trace_rx[:] = self._trace_rx[length:]
         funcname = caller[5:].title().replace('_', '')
         self.log.info(' %s< (%d) %s',
-                      funcname, length, hexlify(payload).decode('utf8'))
+                      funcname, length, payload.hex())
         return True
 
     def _decode_input_mpsse_bits(self, caller):
@@ -460,7 +459,7 @@ class FtdiMpsseEngine:
     def bm2str(cls, value: int, mask: int, hiz: str = '_') -> str:
         vstr = cls.bitfmt(value, 8)
         mstr = cls.bitfmt(mask, 8)
-        return ''.join([m == '1' and v or hiz for v, m in zip(vstr, mstr)])
+        return ''.join([v if m == '1' else hiz for v, m in zip(vstr, mstr)])
 
     @classmethod
     def bitfmt(cls, value, width):